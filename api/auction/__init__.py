@@ -1,4 +1,12 @@
 from auction.auction import Auction
 from auction.auction_manager import AuctionManager, auction_manager
+from auction.auction_team import AuctionTeam
+from auction.auction_ticker import AuctionTicker
 
-__all__ = ["Auction", "AuctionManager", "auction_manager"]
+__all__ = [
+    "Auction",
+    "AuctionManager",
+    "AuctionTeam",
+    "AuctionTicker",
+    "auction_manager",
+]
@@ -1,8 +1,19 @@
 import asyncio
+import logging
 import random
-from typing import Dict, List, Optional
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set, Tuple
 
+from fastapi import WebSocket
+
+from auction.auction_connection import AuctionConnection
+from auction.auction_snapshot import AuctionSnapshotStore
+from auction.auction_spectator import AuctionSpectator
+from auction.auction_team import AuctionTeam
+from auction.auction_ticker import AuctionTicker
 from dtos.auction_dto import (
+    AuctionSnapshot,
     AuctionStateDTO,
     AuctionStatus,
     Team,
@@ -12,9 +23,18 @@ from dtos.auction_dto import (
     StatusMessageData,
     NextUserMessageData,
     QueueUpdateMessageData,
+    QueueDeltaMessageData,
     UserSoldMessageData,
     BidPlacedMessageData,
+    ErrorMessageData,
+    TeamsMessageData,
 )
+from utils.env import get_bid_window
+from utils.serializer import JSON_PROTOCOL, Frame, decode, encode
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOG_SIZE = 64
 
 
 class Auction:
@@ -25,39 +45,112 @@ class Auction:
         teams: List[Team],
         user_ids: List[int],
         user_tokens: Dict[int, str],
+        ticker: AuctionTicker,
         timer_duration: int = 5,
+        snapshot_store: Optional[AuctionSnapshotStore] = None,
     ):
         self.auction_id = auction_id
         self.preset_id = preset_id
         self.status: AuctionStatus = AuctionStatus.WAITING
-        self.teams = {team.team_id: team for team in teams}
+        self.teams: Dict[int, AuctionTeam] = {
+            team.team_id: AuctionTeam.from_dto(team) for team in teams
+        }
+        self.team_seq = 0
         self.user_tokens = user_tokens
         self.token_to_user: Dict[str, int] = {
             token: user_id for user_id, token in user_tokens.items()
         }
         self.connected_tokens: Dict[str, int] = {}
         self.leader_user_ids = {team.leader_id for team in teams}
+        self.leader_to_team: Dict[int, int] = {
+            team.leader_id: team.team_id for team in teams
+        }
 
         auction_users = [uid for uid in user_ids if uid not in self.leader_user_ids]
         shuffled_users = auction_users.copy()
         random.shuffle(shuffled_users)
-        self.auction_queue = shuffled_users
+        self.auction_queue: Deque[int] = deque(shuffled_users)
 
-        self.unsold_queue: List[int] = []
+        self.unsold_queue: Deque[int] = deque()
         self.current_user_id: Optional[int] = None
         self.current_bid: Optional[int] = None
         self.current_bidder: Optional[int] = None
         self.timer_duration = timer_duration
-        self.timer = timer_duration
-        self.timer_task: Optional[asyncio.Task] = None
-        self.connections: List = []
+        self.deadline: Optional[float] = None
+        self.ticker = ticker
+        self.snapshot_store = snapshot_store
+        self.connections: Dict[WebSocket, AuctionConnection] = {}
+        self.event_seq = 0
+        self.event_log: Deque[Tuple[int, Dict[str, Frame]]] = deque(
+            maxlen=EVENT_LOG_SIZE
+        )
+        self.event_waiter: Optional[asyncio.Future] = None
+        self.spectators: Dict[WebSocket, AuctionSpectator] = {}
         self.auto_delete_task: Optional[asyncio.Task] = None
 
-        self.paused_timer: Optional[int] = None
+        self.paused_timer: Optional[float] = None
         self.was_in_progress: bool = False
 
+        self.bid_window = get_bid_window()
+        self.last_bid_at: Dict[str, float] = {}
+        self.pending_bids: Dict[str, Tuple[Optional[int], Set[int]]] = {}
+        self.bid_tasks: Set[asyncio.Task] = set()
+
         self._start_auto_delete_task()
 
+    @classmethod
+    def from_snapshot(
+        cls,
+        snapshot: AuctionSnapshot,
+        ticker: AuctionTicker,
+        snapshot_store: Optional[AuctionSnapshotStore] = None,
+    ) -> "Auction":
+        auction = cls(
+            snapshot.auction_id,
+            snapshot.preset_id,
+            snapshot.teams,
+            list(snapshot.user_tokens.keys()),
+            snapshot.user_tokens,
+            ticker,
+            snapshot.timer_duration,
+            snapshot_store,
+        )
+        auction.team_seq = snapshot.team_seq
+        auction.event_seq = snapshot.seq
+        auction.auction_queue = deque(snapshot.auction_queue)
+        auction.unsold_queue = deque(snapshot.unsold_queue)
+        auction.current_user_id = snapshot.current_user_id
+        auction.current_bid = snapshot.current_bid
+        auction.current_bidder = snapshot.current_bidder
+        auction.paused_timer = snapshot.paused_timer
+        auction.was_in_progress = snapshot.was_in_progress
+        return auction
+
+    def get_snapshot(self) -> AuctionSnapshot:
+        return AuctionSnapshot(
+            auction_id=self.auction_id,
+            preset_id=self.preset_id,
+            status=self.status,
+            teams=self._get_team_dtos(),
+            team_seq=self.team_seq,
+            seq=self.event_seq,
+            user_tokens=self.user_tokens,
+            auction_queue=list(self.auction_queue),
+            unsold_queue=list(self.unsold_queue),
+            current_user_id=self.current_user_id,
+            current_bid=self.current_bid,
+            current_bidder=self.current_bidder,
+            timer_duration=self.timer_duration,
+            paused_timer=(
+                self.get_timer()
+                if self.deadline is not None
+                else self.paused_timer
+            ),
+            was_in_progress=(
+                self.status == AuctionStatus.IN_PROGRESS or self.was_in_progress
+            ),
+        )
+
     def _start_auto_delete_task(self):
         if self.auto_delete_task and not self.auto_delete_task.done():
             self.auto_delete_task.cancel()
@@ -89,12 +182,7 @@ class Auction:
         user_id = self.token_to_user[token]
         is_leader = user_id in self.leader_user_ids
 
-        team_id = None
-        if is_leader:
-            for tid, team in self.teams.items():
-                if team.leader_id == user_id:
-                    team_id = tid
-                    break
+        team_id = self.leader_to_team.get(user_id) if is_leader else None
 
         self.connected_tokens[token] = user_id
 
@@ -114,24 +202,138 @@ class Auction:
         connected_user_ids = set(self.connected_tokens.values())
         return self.leader_user_ids.issubset(connected_user_ids)
 
-    def add_connection(self, websocket):
-        self.connections.append(websocket)
+    def add_connection(
+        self, websocket: WebSocket, protocol: str = JSON_PROTOCOL
+    ):
+        self.connections[websocket] = AuctionConnection(websocket, protocol)
+
+    def remove_connection(self, websocket: WebSocket):
+        connection = self.connections.pop(websocket, None)
+        if connection:
+            connection.stop()
+
+    def add_spectator(
+        self,
+        websocket: WebSocket,
+        protocol: str = JSON_PROTOCOL,
+        last_seq: Optional[int] = None,
+    ):
+        self.spectators[websocket] = AuctionSpectator(
+            websocket, self, protocol, last_seq
+        )
 
-    def remove_connection(self, websocket):
-        if websocket in self.connections:
-            self.connections.remove(websocket)
+    def remove_spectator(self, websocket: WebSocket):
+        spectator = self.spectators.pop(websocket, None)
+        if spectator:
+            spectator.stop()
+
+    def _encode(
+        self,
+        message: WebSocketMessage,
+        seq: Optional[int] = None,
+        protocol: str = JSON_PROTOCOL,
+    ) -> Frame:
+        payload = {"type": message.type, "data": message.data}
+        if seq is not None:
+            payload["seq"] = seq
+        return encode(payload, protocol)
+
+    def _get_frame(self, frames: Dict[str, Frame], protocol: str) -> Frame:
+        frame = frames.get(protocol)
+        if frame is None:
+            frame = encode(decode(frames[JSON_PROTOCOL]), protocol)
+            frames[protocol] = frame
+        return frame
+
+    def send(self, websocket: WebSocket, message: WebSocketMessage):
+        connection = self.connections.get(websocket)
+        if connection and not connection.send(
+            self._encode(message, protocol=connection.protocol)
+        ):
+            self.remove_connection(websocket)
 
     async def broadcast(self, message: WebSocketMessage):
-        disconnected = []
-        message_dict = message.model_dump()
-        for connection in self.connections:
-            try:
-                await connection.send_json(message_dict)
-            except Exception:
-                disconnected.append(connection)
+        self.event_seq += 1
+        protocols = {JSON_PROTOCOL}
+        protocols.update(
+            connection.protocol for connection in self.connections.values()
+        )
+        frames = {
+            protocol: self._encode(message, self.event_seq, protocol)
+            for protocol in protocols
+        }
+        self.event_log.append((self.event_seq, frames))
+
+        if self.event_waiter and not self.event_waiter.done():
+            self.event_waiter.set_result(None)
+
+        if self.snapshot_store:
+            self.snapshot_store.mark_dirty(self)
+
+        for websocket, connection in list(self.connections.items()):
+            if not connection.send(frames[connection.protocol]):
+                self.remove_connection(websocket)
+
+    def get_frames_since(
+        self, last_seq: int, protocol: str = JSON_PROTOCOL
+    ) -> Optional[List[Tuple[int, Frame]]]:
+        missing = self.event_seq - last_seq
+        if missing < 0:
+            return None
+
+        if missing and (
+            not self.event_log or self.event_log[0][0] > last_seq + 1
+        ):
+            return None
+
+        return [
+            (seq, self._get_frame(frames, protocol))
+            for seq, frames in self.event_log
+            if seq > last_seq
+        ]
+
+    async def wait_for_event(self, seq: int):
+        while self.event_seq <= seq:
+            if self.event_waiter is None or self.event_waiter.done():
+                self.event_waiter = asyncio.get_running_loop().create_future()
+            await asyncio.shield(self.event_waiter)
+
+    def replay(self, websocket: WebSocket, last_seq: int) -> bool:
+        connection = self.connections.get(websocket)
+        if not connection:
+            return False
+
+        if self.event_seq - last_seq > connection.queue.maxsize:
+            return False
+
+        frames = self.get_frames_since(last_seq, connection.protocol)
+        if frames is None:
+            return False
+
+        for _, frame in frames:
+            connection.send(frame)
+
+        if self.deadline is not None:
+            self.send(websocket, self._get_timer_message())
 
-        for conn in disconnected:
-            self.remove_connection(conn)
+        return True
+
+    def get_spectator_init(self, protocol: str) -> Tuple[int, Frame]:
+        init = {
+            **self.get_state().model_dump(),
+            "team_id": None,
+            "user_id": None,
+            "is_leader": False,
+        }
+        return self.event_seq, self._encode(
+            WebSocketMessage(type=MessageType.INIT, data=init),
+            protocol=protocol,
+        )
+
+    def get_timer_frame(self, protocol: str) -> Optional[Frame]:
+        if self.deadline is None:
+            return None
+        return self._encode(self._get_timer_message(), protocol=protocol)
 
     def get_state(self) -> AuctionStateDTO:
         return AuctionStateDTO(
@@ -141,12 +343,21 @@ class Auction:
             current_user_id=self.current_user_id,
             current_bid=self.current_bid,
             current_bidder=self.current_bidder,
-            timer=self.timer,
-            teams=list(self.teams.values()),
-            auction_queue=self.auction_queue,
-            unsold_queue=self.unsold_queue,
+            timer=self.get_timer(),
+            teams=self._get_team_dtos(),
+            team_seq=self.team_seq,
+            seq=self.event_seq,
+            auction_queue=list(self.auction_queue),
+            unsold_queue=list(self.unsold_queue),
         )
 
+    def get_timer(self) -> float:
+        if self.deadline is not None:
+            return max(0.0, self.deadline - time.monotonic())
+        if self.paused_timer is not None:
+            return self.paused_timer
+        return float(self.timer_duration)
+
     async def set_status(self, new_status: AuctionStatus):
         if self.status == AuctionStatus.COMPLETED:
             return
@@ -157,12 +368,9 @@ class Auction:
         if new_status == AuctionStatus.WAITING:
             if self.status == AuctionStatus.IN_PROGRESS:
                 self.was_in_progress = True
-                is_timer_running = (
-                    self.timer_task
-                    and not self.timer_task.done()
-                    and not self.timer_task.cancelled()
+                self.paused_timer = (
+                    self.get_timer() if self.deadline is not None else None
                 )
-                self.paused_timer = self.timer if is_timer_running else None
 
             self._stop_timer()
             self._start_auto_delete_task()
@@ -190,120 +398,146 @@ class Auction:
         await self.broadcast(
             WebSocketMessage(
                 type=MessageType.STATUS,
-                data=StatusMessageData(status=str(self.status.value)).model_dump(),
+                data=StatusMessageData(status=str(self.status.value)),
             )
         )
 
     def _stop_timer(self):
-        if self.timer_task and not self.timer_task.done():
-            self.timer_task.cancel()
+        self.deadline = None
+        self.ticker.unregister(self)
 
     async def _start_timer(self):
         if self.paused_timer is not None:
-            self.timer = self.paused_timer
+            remaining = self.paused_timer
             self.paused_timer = None
         else:
-            self.timer = self.timer_duration
+            remaining = float(self.timer_duration)
+
+        self.deadline = time.monotonic() + remaining
+
+        await self.broadcast(self._get_timer_message())
 
-        self.timer_task = asyncio.create_task(self._timer())
+        self.ticker.register(self)
+
+    def _get_timer_message(self) -> WebSocketMessage:
+        remaining = self.get_timer()
+        return WebSocketMessage(
+            type=MessageType.TIMER,
+            data=TimerMessageData(
+                timer=remaining,
+                deadline=time.time() + remaining,
+            ),
+        )
 
-    async def _next_user(self):
+    async def _next_user(self, unsold_user_id: Optional[int] = None):
         self._stop_timer()
 
         incomplete_teams = [
-            team for team in self.teams.values() if len(team.member_id_list) < 5
+            team for team in self.teams.values() if len(team.member_ids) < 5
         ]
 
         if len(incomplete_teams) == 1:
             incomplete_team = incomplete_teams[0]
-            remaining_users = self.auction_queue + self.unsold_queue
+            remaining_users = [*self.auction_queue, *self.unsold_queue]
+            self.auction_queue = deque()
+            self.unsold_queue = deque()
 
             for user_id in remaining_users:
-                if len(incomplete_team.member_id_list) < 5:
-                    incomplete_team.member_id_list.append(user_id)
+                if len(incomplete_team.member_ids) < 5:
+                    await self._sell_user(incomplete_team, user_id, 0)
                 else:
                     self.unsold_queue.append(user_id)
 
-            self.auction_queue = []
-
-            await self.broadcast(
-                WebSocketMessage(
-                    type=MessageType.USER_SOLD,
-                    data=UserSoldMessageData(
-                        teams=list(self.teams.values())
-                    ).model_dump(),
-                )
-            )
-
             await self.broadcast(
                 WebSocketMessage(
                     type=MessageType.QUEUE_UPDATE,
                     data=QueueUpdateMessageData(
-                        auction_queue=self.auction_queue,
-                        unsold_queue=self.unsold_queue,
-                    ).model_dump(),
+                        auction_queue=list(self.auction_queue),
+                        unsold_queue=list(self.unsold_queue),
+                    ),
                 )
             )
 
             await self.set_status(AuctionStatus.COMPLETED)
             return
 
+        recycled = False
         if not self.auction_queue and self.unsold_queue:
-            self.auction_queue = self.unsold_queue.copy()
-            self.unsold_queue = []
+            self.auction_queue, self.unsold_queue = self.unsold_queue, deque()
+            recycled = True
 
         if self.auction_queue:
-            self.current_user_id = self.auction_queue.pop(0)
+            self.current_user_id = self.auction_queue.popleft()
         else:
             await self.set_status(AuctionStatus.COMPLETED)
             return
 
         self.current_bid = None
         self.current_bidder = None
-        self.timer = self.timer_duration
 
         await self.broadcast(
             WebSocketMessage(
                 type=MessageType.NEXT_USER,
                 data=NextUserMessageData(
                     user_id=self.current_user_id,
-                ).model_dump(),
+                ),
             )
         )
 
         await self.broadcast(
             WebSocketMessage(
-                type=MessageType.QUEUE_UPDATE,
-                data=QueueUpdateMessageData(
-                    auction_queue=self.auction_queue,
-                    unsold_queue=self.unsold_queue,
-                ).model_dump(),
+                type=MessageType.QUEUE_DELTA,
+                data=QueueDeltaMessageData(
+                    unsold=unsold_user_id,
+                    recycled=recycled,
+                    popped=self.current_user_id,
+                ),
             )
         )
 
         await self._start_timer()
 
-    async def _timer(self):
-        try:
-            while self.timer > 0:
-                await self.broadcast(
-                    WebSocketMessage(
-                        type=MessageType.TIMER,
-                        data=TimerMessageData(timer=self.timer).model_dump(),
-                    )
-                )
+    async def tick(self):
+        if self.deadline is None or time.monotonic() < self.deadline:
+            return
 
-                await asyncio.sleep(1)
-                self.timer -= 1
+        self._stop_timer()
+        await self.timer_expired()
 
-            await self.timer_expired()
+    async def _sell_user(self, team: AuctionTeam, user_id: int, price: int):
+        team.add_member(user_id, price)
+        self.team_seq += 1
 
-        except asyncio.CancelledError:
-            pass
+        await self.broadcast(
+            WebSocketMessage(
+                type=MessageType.USER_SOLD,
+                data=UserSoldMessageData(
+                    seq=self.team_seq,
+                    team_id=team.team_id,
+                    user_id=user_id,
+                    price=price,
+                    points=team.points,
+                ),
+            )
+        )
+
+    def _get_team_dtos(self) -> List[Team]:
+        return [team.to_dto() for team in self.teams.values()]
+
+    def get_teams_message(self) -> WebSocketMessage:
+        return WebSocketMessage(
+            type=MessageType.TEAMS,
+            data=TeamsMessageData(
+                seq=self.team_seq,
+                teams=self._get_team_dtos(),
+            ),
+        )
 
     async def timer_expired(self):
+        unsold_user_id = None
         if self.current_bid is None or self.current_bidder is None:
-            self.unsold_queue.append(self.current_user_id)
+            unsold_user_id = self.current_user_id
+            self.unsold_queue.append(unsold_user_id)
 
             await self.broadcast(
                 WebSocketMessage(
@@ -312,20 +546,87 @@ class Auction:
                 )
             )
         else:
-            team = self.teams[self.current_bidder]
-            team.points -= self.current_bid
-            team.member_id_list.append(self.current_user_id)
+            await self._sell_user(
+                self.teams[self.current_bidder],
+                self.current_user_id,
+                self.current_bid,
+            )
 
-            await self.broadcast(
+        await self._next_user(unsold_user_id)
+
+    async def submit_bid(self, websocket: WebSocket, token: str, amount: int):
+        pending = self.pending_bids.get(token)
+        if pending is not None:
+            user_id, amounts = pending
+            if user_id == self.current_user_id:
+                amounts.add(amount)
+            else:
+                self.pending_bids[token] = (self.current_user_id, {amount})
+            return
+
+        now = time.monotonic()
+        wait = self.last_bid_at.get(token, 0.0) + self.bid_window - now
+        if wait <= 0:
+            self.last_bid_at[token] = now
+            await self._process_bids(websocket, token, {amount})
+            return
+
+        self.pending_bids[token] = (self.current_user_id, {amount})
+        asyncio.get_running_loop().call_later(
+            wait, self._schedule_pending_bids, websocket, token
+        )
+
+    def _schedule_pending_bids(self, websocket: WebSocket, token: str):
+        task = asyncio.create_task(self._flush_pending_bids(websocket, token))
+        self.bid_tasks.add(task)
+        task.add_done_callback(self._on_bid_task_done)
+
+    def _on_bid_task_done(self, task: asyncio.Task):
+        self.bid_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(
+                f"Bid flush error: {self.auction_id} - {task.exception()}"
+            )
+
+    async def _flush_pending_bids(self, websocket: WebSocket, token: str):
+        pending = self.pending_bids.pop(token, None)
+        if not pending:
+            return
+
+        user_id, amounts = pending
+        self.last_bid_at[token] = time.monotonic()
+
+        if user_id != self.current_user_id:
+            self.send(
+                websocket,
                 WebSocketMessage(
-                    type=MessageType.USER_SOLD,
-                    data=UserSoldMessageData(
-                        teams=list(self.teams.values())
-                    ).model_dump(),
-                )
+                    type=MessageType.ERROR,
+                    data=ErrorMessageData(
+                        error="Bid expired, user changed before it was placed"
+                    ),
+                ),
             )
+            return
+
+        await self._process_bids(websocket, token, amounts)
 
-        await self._next_user()
+    async def _process_bids(
+        self, websocket: WebSocket, token: str, amounts: Set[int]
+    ):
+        error = None
+        for amount in sorted(amounts, reverse=True):
+            result = await self.place_bid(token, amount)
+            if result["success"]:
+                return
+            error = error or result["error"]
+
+        self.send(
+            websocket,
+            WebSocketMessage(
+                type=MessageType.ERROR,
+                data=ErrorMessageData(error=error),
+            ),
+        )
 
     async def place_bid(self, token: str, amount: int) -> Dict:
         if token not in self.connected_tokens:
@@ -336,11 +637,7 @@ class Auction:
         if user_id not in self.leader_user_ids:
             return {"success": False, "error": "Only leaders can place bids"}
 
-        team_id = None
-        for tid, team in self.teams.items():
-            if team.leader_id == user_id:
-                team_id = tid
-                break
+        team_id = self.leader_to_team.get(user_id)
 
         if team_id is None:
             return {"success": False, "error": "Team not found"}
@@ -356,10 +653,10 @@ class Auction:
 
         team = self.teams[team_id]
 
-        if len(team.member_id_list) >= 5:
+        if len(team.member_ids) >= 5:
             return {"success": False, "error": "Team already has 5 members"}
 
-        remaining_slots = 5 - len(team.member_id_list)
+        remaining_slots = 5 - len(team.member_ids)
         min_points_to_reserve = remaining_slots - 1
         max_allowed_bid = team.points - min_points_to_reserve
 
@@ -382,9 +679,6 @@ class Auction:
         self.current_bid = amount
         self.current_bidder = team_id
 
-        if self.timer_task and not self.timer_task.done():
-            self.timer_task.cancel()
-
         await self.broadcast(
             WebSocketMessage(
                 type=MessageType.BID_PLACED,
@@ -392,7 +686,7 @@ class Auction:
                     team_id=team_id,
                     leader_id=team.leader_id,
                     amount=amount,
-                ).model_dump(),
+                ),
             )
         )
 
@@ -401,18 +695,23 @@ class Auction:
         return {"success": True}
 
     async def terminate_auction(self):
-        if self.timer_task and not self.timer_task.done():
-            self.timer_task.cancel()
+        self._stop_timer()
+
+        self.pending_bids.clear()
+        for task in list(self.bid_tasks):
+            task.cancel()
 
-        for connection in self.connections[:]:
-            try:
-                await connection.close()
-            except Exception:
-                pass
+        for connection in list(self.connections.values()):
+            await connection.close()
 
         self.connections.clear()
         self.connected_tokens.clear()
 
+        for spectator in list(self.spectators.values()):
+            await spectator.close()
+
+        self.spectators.clear()
+
     async def _delayed_terminate(self):
         await asyncio.sleep(5)
         await self.terminate_auction()
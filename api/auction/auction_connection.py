@@ -0,0 +1,64 @@
+import asyncio
+import logging
+
+from fastapi import WebSocket
+
+from utils.serializer import JSON_PROTOCOL, Frame
+
+logger = logging.getLogger(__name__)
+
+SEND_QUEUE_SIZE = 64
+OVERFLOW_CLOSE_CODE = 1013
+
+
+class AuctionConnection:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        protocol: str = JSON_PROTOCOL,
+        queue_size: int = SEND_QUEUE_SIZE,
+    ):
+        self.websocket = websocket
+        self.protocol = protocol
+        self.queue: asyncio.Queue[Frame] = asyncio.Queue(maxsize=queue_size)
+        self.closed = False
+        self.writer_task = asyncio.create_task(self._writer())
+
+    def send(self, frame: Frame) -> bool:
+        if self.closed:
+            return False
+
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Send queue full, dropping connection")
+            self.stop()
+            asyncio.create_task(self.close(code=OVERFLOW_CLOSE_CODE))
+            return False
+
+    async def _writer(self):
+        try:
+            while True:
+                frame = await self.queue.get()
+                if isinstance(frame, bytes):
+                    await self.websocket.send_bytes(frame)
+                else:
+                    await self.websocket.send_text(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Send failed: {type(e).__name__}")
+            self.closed = True
+
+    def stop(self):
+        self.closed = True
+        if not self.writer_task.done():
+            self.writer_task.cancel()
+
+    async def close(self, code: int = 1000):
+        self.stop()
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
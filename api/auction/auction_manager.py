@@ -1,8 +1,14 @@
+import logging
 import uuid
-from typing import Dict, Optional, List
+from typing import Any, Awaitable, Callable, Dict, Optional, List
 
 from auction.auction import Auction
-from dtos.auction_dto import Team
+from auction.auction_snapshot import AuctionSnapshotStore
+from auction.auction_ticker import AuctionTicker
+from dtos.auction_dto import AuctionStatus, Team
+from utils.env import get_auction_snapshot_path, get_auction_store
+
+logger = logging.getLogger(__name__)
 
 
 class Token:
@@ -22,8 +28,15 @@ class AuctionManager:
         self.tokens: Dict[str, Token] = {}
         self.auction_tokens: Dict[str, List[str]] = {}
         self.next_auction_id: int = 1
+        self.ticker = AuctionTicker()
+        self.snapshot_store: Optional[AuctionSnapshotStore] = (
+            AuctionSnapshotStore(get_auction_snapshot_path())
+        )
+        self.is_primary = True
+        self.commands: Dict[str, Callable[..., Any]] = {}
+        self.elected_handlers: List[Callable[[], Awaitable[None]]] = []
 
-    def add_auction(
+    async def add_auction(
         self,
         preset_id: int,
         teams: list[Team],
@@ -31,37 +44,110 @@ class AuctionManager:
         leader_user_ids: set[int],
         time: int,
     ) -> tuple[str, Dict[int, str]]:
+        auction_id = await self._allocate_auction_id()
+        user_tokens = {user_id: str(uuid.uuid4()) for user_id in user_ids}
+
+        auction = Auction(
+            auction_id,
+            preset_id,
+            teams,
+            user_ids,
+            user_tokens,
+            self.ticker,
+            time,
+            self.snapshot_store,
+        )
+        self._register_auction(auction, leader_user_ids)
+        await self._save_tokens(auction, leader_user_ids)
+        if self.snapshot_store:
+            self.snapshot_store.mark_dirty(auction)
+
+        return auction_id, user_tokens
+
+    async def _allocate_auction_id(self) -> str:
         auction_id = str(self.next_auction_id)
         self.next_auction_id += 1
-        user_tokens = {}
-        auction_token_list = []
+        return auction_id
 
-        for user_id in user_ids:
-            token = str(uuid.uuid4())
-            user_tokens[user_id] = token
+    def _register_auction(self, auction: Auction, leader_user_ids: set[int]):
+        auction_token_list = []
 
+        for user_id, token in auction.user_tokens.items():
             token_info = Token(
-                auction_id=auction_id,
+                auction_id=auction.auction_id,
                 user_id=user_id,
                 token=token,
                 is_leader=user_id in leader_user_ids,
             )
             self.tokens[token] = token_info
-            self.token_to_auction[token] = auction_id
+            self.token_to_auction[token] = auction.auction_id
             auction_token_list.append(token)
 
-        auction = Auction(
-            auction_id,
-            preset_id,
-            teams,
-            user_ids,
-            user_tokens,
-            time,
-        )
-        self.auctions[auction_id] = auction
-        self.auction_tokens[auction_id] = auction_token_list
+        self.auctions[auction.auction_id] = auction
+        self.auction_tokens[auction.auction_id] = auction_token_list
 
-        return auction_id, user_tokens
+    async def _save_tokens(self, auction: Auction, leader_user_ids: set[int]):
+        pass
+
+    def restore_auctions(self):
+        if not self.snapshot_store:
+            return
+
+        try:
+            snapshots = self.snapshot_store.load()
+        except Exception as e:
+            logger.error(f"Snapshot load error: {e}")
+            return
+
+        for snapshot in snapshots:
+            if snapshot.status == AuctionStatus.COMPLETED:
+                continue
+
+            auction = Auction.from_snapshot(
+                snapshot, self.ticker, self.snapshot_store
+            )
+            self._register_auction(auction, auction.leader_user_ids)
+            self.next_auction_id = max(
+                self.next_auction_id, int(snapshot.auction_id) + 1
+            )
+
+        logger.info(f"Restored {len(self.auctions)} auctions")
+
+    async def start(self):
+        self.restore_auctions()
+        await self._run_elected_handlers()
+
+    async def stop(self):
+        if self.snapshot_store:
+            await self.snapshot_store.stop()
+
+    def register_elected_handler(self, handler: Callable[[], Awaitable[None]]):
+        self.elected_handlers.append(handler)
+
+    async def _run_elected_handlers(self):
+        for handler in self.elected_handlers:
+            try:
+                await handler()
+            except Exception as e:
+                logger.error(f"Elected handler error: {e}")
+
+    def register_command(self, command: str, handler: Callable[..., Any]):
+        self.commands[command] = handler
+
+    def forward(self, command: str, data: Dict[str, Any]) -> bool:
+        return False
+
+    async def call_primary(self, command: str, data: Dict[str, Any]) -> bool:
+        return False
+
+    async def get_remote_address(self, token: str) -> Optional[str]:
+        return None
+
+    async def get_auction_address(self, auction_id: str) -> Optional[str]:
+        return None
+
+    async def remove_owner(self, address: str):
+        pass
 
     def get_auction(self, auction_id: str) -> Optional[Auction]:
         return self.auctions.get(auction_id)
@@ -72,7 +158,7 @@ class AuctionManager:
             return self.auctions.get(auction_id)
         return None
 
-    def get_token(self, token: str) -> Optional[Token]:
+    async def get_token(self, token: str) -> Optional[Token]:
         return self.tokens.get(token)
 
     def get_tokens(self, auction_id: str) -> List[Token]:
@@ -102,6 +188,16 @@ class AuctionManager:
                 del self.auction_tokens[auction_id]
 
             del self.auctions[auction_id]
+            if self.snapshot_store:
+                self.snapshot_store.mark_removed(auction_id)
+
+
+def create_auction_manager() -> AuctionManager:
+    if get_auction_store() == "shared":
+        from auction.shared_auction_manager import SharedAuctionManager
+
+        return SharedAuctionManager()
+    return AuctionManager()
 
 
-auction_manager = AuctionManager()
+auction_manager = create_auction_manager()
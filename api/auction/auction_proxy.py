@@ -0,0 +1,166 @@
+import asyncio
+import json
+import logging
+import struct
+from typing import Optional, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from utils.serializer import JSON_PROTOCOL, MSGPACK_PROTOCOL
+
+logger = logging.getLogger(__name__)
+
+FRAME_HEADER = struct.Struct("!BI")
+TEXT_FRAME = 0
+BINARY_FRAME = 1
+CLOSE_FRAME = 2
+
+
+def encode_frame(kind: int, payload: bytes) -> bytes:
+    return FRAME_HEADER.pack(kind, len(payload)) + payload
+
+
+async def read_frame(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[int, bytes]]:
+    try:
+        header = await reader.readexactly(FRAME_HEADER.size)
+        kind, size = FRAME_HEADER.unpack(header)
+        return kind, await reader.readexactly(size)
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def encode_close(code: int, reason: Optional[str]) -> bytes:
+    payload = json.dumps({"code": code, "reason": reason}).encode()
+    return encode_frame(CLOSE_FRAME, payload)
+
+
+class StreamWebSocket:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+
+    async def accept(self, subprotocol: Optional[str] = None):
+        pass
+
+    async def _send(self, kind: int, payload: bytes):
+        if self.closed:
+            raise WebSocketDisconnect()
+        self.writer.write(encode_frame(kind, payload))
+        await self.writer.drain()
+
+    async def send_text(self, data: str):
+        await self._send(TEXT_FRAME, data.encode())
+
+    async def send_bytes(self, data: bytes):
+        await self._send(BINARY_FRAME, data)
+
+    async def send_json(self, data: dict):
+        await self.send_text(json.dumps(data))
+
+    async def _receive(self) -> bytes:
+        frame = await read_frame(self.reader)
+        if frame is None or frame[0] == CLOSE_FRAME:
+            self.closed = True
+            raise WebSocketDisconnect()
+        return frame[1]
+
+    async def receive_text(self) -> str:
+        return (await self._receive()).decode()
+
+    async def receive_bytes(self) -> bytes:
+        return await self._receive()
+
+    async def close(self, code: int = 1000, reason: Optional[str] = None):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.writer.write(encode_close(code, reason))
+            await self.writer.drain()
+            self.writer.close()
+        except Exception:
+            pass
+
+
+async def read_handshake(reader: asyncio.StreamReader) -> dict:
+    line = await reader.readline()
+    if not line.strip():
+        return {}
+    return json.loads(line)
+
+
+async def proxy_websocket(
+    websocket: WebSocket,
+    address: str,
+    handshake: dict,
+    protocol: str = JSON_PROTOCOL,
+    subprotocol: Optional[str] = None,
+) -> bool:
+    try:
+        reader, writer = await asyncio.open_unix_connection(address)
+    except OSError as e:
+        logger.warning(f"Owner unreachable: {address} - {e}")
+        await websocket.close(code=4004, reason="Auction not found")
+        return False
+
+    handshake = {**handshake, "protocol": protocol}
+    writer.write(json.dumps(handshake).encode() + b"\n")
+    await writer.drain()
+    await websocket.accept(subprotocol=subprotocol)
+
+    async def client_to_owner():
+        try:
+            while True:
+                if protocol == MSGPACK_PROTOCOL:
+                    frame = encode_frame(
+                        BINARY_FRAME, await websocket.receive_bytes()
+                    )
+                else:
+                    frame = encode_frame(
+                        TEXT_FRAME, (await websocket.receive_text()).encode()
+                    )
+                writer.write(frame)
+                await writer.drain()
+        except WebSocketDisconnect:
+            pass
+
+    async def owner_to_client():
+        while True:
+            frame = await read_frame(reader)
+            if frame is None:
+                await websocket.close()
+                return
+
+            kind, payload = frame
+            if kind == CLOSE_FRAME:
+                close = json.loads(payload)
+                await websocket.close(
+                    code=close["code"], reason=close["reason"] or None
+                )
+                return
+
+            if kind == BINARY_FRAME:
+                await websocket.send_bytes(payload)
+            else:
+                await websocket.send_text(payload.decode())
+
+    tasks = [
+        asyncio.create_task(client_to_owner()),
+        asyncio.create_task(owner_to_client()),
+    ]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+    return True
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from dtos.auction_dto import AuctionSnapshot, AuctionSnapshotRecord
+
+if TYPE_CHECKING:
+    from auction.auction import Auction
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INTERVAL = 1
+COMPACT_MIN_SIZE = 1024 * 1024
+COMPACT_RATIO = 4
+
+
+class AuctionSnapshotStore:
+    def __init__(self, path: Path, interval: float = SNAPSHOT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.dirty: Dict[str, Optional["Auction"]] = {}
+        self.flush_task: Optional[asyncio.Task] = None
+        self.live: Dict[str, str] = {}
+        self.size = path.stat().st_size if path.exists() else 0
+        self.write_lock = threading.RLock()
+        self.generation = 0
+        self.rewrite_generation = 0
+
+    def mark_dirty(self, auction: "Auction"):
+        self.dirty[auction.auction_id] = auction
+        self._ensure_flush_task()
+
+    def mark_removed(self, auction_id: str):
+        self.dirty[auction_id] = None
+        self._ensure_flush_task()
+
+    def _ensure_flush_task(self):
+        if self.flush_task is None or self.flush_task.done():
+            self.flush_task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        try:
+            while self.dirty:
+                await asyncio.sleep(self.interval)
+                await self.flush()
+        except asyncio.CancelledError:
+            pass
+
+    def _take_lines(self, compact: bool = False) -> Tuple[List[str], bool, int]:
+        self.generation += 1
+        dirty, self.dirty = self.dirty, {}
+        lines = []
+        for auction_id, auction in dirty.items():
+            record = AuctionSnapshotRecord(
+                auction_id=auction_id,
+                snapshot=auction.get_snapshot() if auction else None,
+            )
+            line = record.model_dump_json() + "\n"
+            if auction:
+                self.live[auction_id] = line
+            else:
+                self.live.pop(auction_id, None)
+            lines.append(line)
+
+        if not lines and not compact:
+            return lines, False, self.generation
+
+        self.size += sum(len(line) for line in lines)
+        live_size = sum(len(line) for line in self.live.values())
+        if not compact and self.size <= max(
+            COMPACT_MIN_SIZE, live_size * COMPACT_RATIO
+        ):
+            return lines, False, self.generation
+
+        self.size = live_size
+        return list(self.live.values()), True, self.generation
+
+    def _append(self, lines: List[str]):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    def _write(self, lines: List[str], compact: bool, generation: int):
+        with self.write_lock:
+            if generation < self.rewrite_generation:
+                return
+
+            if compact:
+                self.rewrite_generation = generation
+                logger.info(f"Snapshot compacted: {len(lines)} auctions")
+                self._rewrite(lines)
+            else:
+                self._append(lines)
+
+    async def flush(self, compact: bool = False):
+        lines, compact, generation = self._take_lines(compact)
+        if not lines and not compact:
+            return
+
+        try:
+            await asyncio.to_thread(self._write, lines, compact, generation)
+        except Exception as e:
+            logger.error(f"Snapshot write error: {e}")
+
+    def flush_sync(self):
+        lines, compact, generation = self._take_lines(True)
+        try:
+            self._write(lines, compact, generation)
+        except Exception as e:
+            logger.error(f"Snapshot write error: {e}")
+
+    def load(self) -> List[AuctionSnapshot]:
+        if not self.path.exists():
+            return []
+
+        snapshots: Dict[str, AuctionSnapshot] = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = AuctionSnapshotRecord.model_validate_json(line)
+                except Exception as e:
+                    logger.warning(f"Snapshot record skipped: {e}")
+                    continue
+
+                if record.snapshot is None:
+                    snapshots.pop(record.auction_id, None)
+                else:
+                    snapshots[record.auction_id] = record.snapshot
+
+        self.live = {
+            auction_id: AuctionSnapshotRecord(
+                auction_id=auction_id, snapshot=snapshot
+            ).model_dump_json()
+            + "\n"
+            for auction_id, snapshot in snapshots.items()
+        }
+        with self.write_lock:
+            self._rewrite(list(self.live.values()))
+        self.size = sum(len(line) for line in self.live.values())
+        return list(snapshots.values())
+
+    def _rewrite(self, lines: List[str]):
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(temp_path, self.path)
+
+    async def stop(self):
+        if self.flush_task and not self.flush_task.done():
+            self.flush_task.cancel()
+        self.flush_task = None
+        await self.flush(True)
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional
+
+from fastapi import WebSocket
+
+from utils.serializer import JSON_PROTOCOL, Frame
+
+if TYPE_CHECKING:
+    from auction.auction import Auction
+
+logger = logging.getLogger(__name__)
+
+LAGGING_CLOSE_CODE = 1013
+
+
+class AuctionSpectator:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        auction: "Auction",
+        protocol: str = JSON_PROTOCOL,
+        last_seq: Optional[int] = None,
+    ):
+        self.websocket = websocket
+        self.auction = auction
+        self.protocol = protocol
+        self.seq = last_seq
+        self.writer_task = asyncio.create_task(self._writer())
+
+    async def _send(self, frame: Frame):
+        if isinstance(frame, bytes):
+            await self.websocket.send_bytes(frame)
+        else:
+            await self.websocket.send_text(frame)
+
+    async def _join(self):
+        frames = None
+        if self.seq is not None:
+            frames = self.auction.get_frames_since(self.seq, self.protocol)
+
+        if frames is None:
+            self.seq, frame = self.auction.get_spectator_init(self.protocol)
+            await self._send(frame)
+            return
+
+        for seq, frame in frames:
+            await self._send(frame)
+            self.seq = seq
+
+        timer_frame = self.auction.get_timer_frame(self.protocol)
+        if timer_frame is not None:
+            await self._send(timer_frame)
+
+    async def _writer(self):
+        try:
+            await self._join()
+
+            while True:
+                await self.auction.wait_for_event(self.seq)
+
+                frames = self.auction.get_frames_since(self.seq, self.protocol)
+                if frames is None:
+                    logger.warning("Spectator lagging, dropping connection")
+                    await self.close(code=LAGGING_CLOSE_CODE)
+                    return
+
+                for seq, frame in frames:
+                    await self._send(frame)
+                    self.seq = seq
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Spectator send failed: {type(e).__name__}")
+
+    def stop(self):
+        if not self.writer_task.done():
+            self.writer_task.cancel()
+
+    async def close(self, code: int = 1000):
+        if asyncio.current_task() is not self.writer_task:
+            self.stop()
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
@@ -0,0 +1,41 @@
+from array import array
+from typing import Optional
+
+from dtos.auction_dto import Team
+
+
+class AuctionTeam:
+    __slots__ = ("team_id", "leader_id", "member_ids", "points", "_dto")
+
+    def __init__(
+        self, team_id: int, leader_id: int, member_ids: array, points: int
+    ):
+        self.team_id = team_id
+        self.leader_id = leader_id
+        self.member_ids = member_ids
+        self.points = points
+        self._dto: Optional[Team] = None
+
+    @classmethod
+    def from_dto(cls, team: Team) -> "AuctionTeam":
+        return cls(
+            team.team_id,
+            team.leader_id,
+            array("q", team.member_id_list),
+            team.points,
+        )
+
+    def add_member(self, user_id: int, price: int):
+        self.member_ids.append(user_id)
+        self.points -= price
+        self._dto = None
+
+    def to_dto(self) -> Team:
+        if self._dto is None:
+            self._dto = Team.model_construct(
+                team_id=self.team_id,
+                leader_id=self.leader_id,
+                member_id_list=self.member_ids.tolist(),
+                points=self.points,
+            )
+        return self._dto
@@ -0,0 +1,45 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from auction.auction import Auction
+
+logger = logging.getLogger(__name__)
+
+TICK_INTERVAL = 0.1
+
+
+class AuctionTicker:
+    def __init__(self, interval: float = TICK_INTERVAL):
+        self.interval = interval
+        self.auctions: Dict[str, "Auction"] = {}
+        self.tick_task: Optional[asyncio.Task] = None
+
+    def register(self, auction: "Auction"):
+        self.auctions[auction.auction_id] = auction
+
+        if self.tick_task is None or self.tick_task.done():
+            self.tick_task = asyncio.create_task(self._run())
+
+    def unregister(self, auction: "Auction"):
+        self.auctions.pop(auction.auction_id, None)
+
+    def is_registered(self, auction: "Auction") -> bool:
+        return self.auctions.get(auction.auction_id) is auction
+
+    async def _run(self):
+        try:
+            while self.auctions:
+                await asyncio.sleep(self.interval)
+
+                for auction in list(self.auctions.values()):
+                    if not self.is_registered(auction):
+                        continue
+
+                    try:
+                        await auction.tick()
+                    except Exception as e:
+                        logger.error(f"Tick error: {auction.auction_id} - {e}")
+        except asyncio.CancelledError:
+            pass
@@ -0,0 +1,382 @@
+import asyncio
+import fcntl
+import inspect
+import json
+import logging
+import os
+from concurrent.futures import Future
+from typing import IO, Any, Dict, List, Optional, Set
+
+from auction.auction import Auction
+from auction.auction_manager import AuctionManager, Token
+from auction.auction_proxy import StreamWebSocket, read_handshake
+from entities.auction_owner import AuctionOwner
+from entities.auction_token import AuctionToken
+from utils.env import get_auction_socket_dir
+from utils.serializer import JSON_PROTOCOL
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_LOCK = "primary.lock"
+PRIMARY_RETRY_INTERVAL = 5
+
+
+class SharedAuctionManager(AuctionManager):
+    def __init__(self):
+        super().__init__()
+        self.snapshot_store = None
+        self.address = str(get_auction_socket_dir() / f"{os.getpid()}.sock")
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.primary_lock: Optional[IO[str]] = None
+        self.forwarded: Set[Future] = set()
+        self.election_task: Optional[asyncio.Task] = None
+        self.is_primary = False
+
+    def _get_db(self):
+        from utils.database import get_db
+
+        return next(get_db())
+
+    def _insert_owner(self) -> str:
+        db = self._get_db()
+        try:
+            owner = AuctionOwner(address=self.address)
+            db.add(owner)
+            db.commit()
+            return str(owner.auction_id)
+        finally:
+            db.close()
+
+    async def _allocate_auction_id(self) -> str:
+        return await asyncio.to_thread(self._insert_owner)
+
+    def _insert_tokens(self, auction: Auction, leader_user_ids: set[int]):
+        db = self._get_db()
+        try:
+            for user_id, token in auction.user_tokens.items():
+                db.add(
+                    AuctionToken(
+                        token=token,
+                        auction_id=int(auction.auction_id),
+                        user_id=user_id,
+                        is_leader=user_id in leader_user_ids,
+                    )
+                )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _save_tokens(self, auction: Auction, leader_user_ids: set[int]):
+        await asyncio.to_thread(self._insert_tokens, auction, leader_user_ids)
+
+    def _delete_auction(self, auction_id: str):
+        db = self._get_db()
+        try:
+            db.query(AuctionToken).filter(
+                AuctionToken.auction_id == int(auction_id)
+            ).delete()
+            db.query(AuctionOwner).filter(
+                AuctionOwner.auction_id == int(auction_id)
+            ).delete()
+            db.commit()
+        except Exception as e:
+            logger.error(f"Auction owner delete error: {auction_id} - {e}")
+        finally:
+            db.close()
+
+    def remove_auction(self, auction_id: str):
+        super().remove_auction(auction_id)
+
+        if self.loop and self.loop.is_running():
+            self.loop.run_in_executor(None, self._delete_auction, auction_id)
+        else:
+            self._delete_auction(auction_id)
+
+    def _delete_owners(self, address: str):
+        db = self._get_db()
+        try:
+            auction_ids = db.query(AuctionOwner.auction_id).filter(
+                AuctionOwner.address == address
+            )
+            db.query(AuctionToken).filter(
+                AuctionToken.auction_id.in_(auction_ids.scalar_subquery())
+            ).delete(synchronize_session=False)
+            db.query(AuctionOwner).filter(
+                AuctionOwner.address == address
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def remove_owner(self, address: str):
+        logger.info(f"Removing auctions of dead owner: {address}")
+        try:
+            await asyncio.to_thread(self._delete_owners, address)
+        except Exception as e:
+            logger.error(f"Owner delete error: {address} - {e}")
+
+    def _get_owner_addresses(self) -> List[str]:
+        db = self._get_db()
+        try:
+            return [
+                address
+                for (address,) in db.query(AuctionOwner.address).distinct()
+            ]
+        finally:
+            db.close()
+
+    async def _is_reachable(self, address: str) -> bool:
+        try:
+            _, writer = await asyncio.open_unix_connection(address)
+        except OSError:
+            return False
+
+        writer.close()
+        return True
+
+    async def _remove_dead_owners(self):
+        await self.remove_owner(self.address)
+
+        addresses = await asyncio.to_thread(self._get_owner_addresses)
+        for address in addresses:
+            if address != self.address and not await self._is_reachable(
+                address
+            ):
+                await self.remove_owner(address)
+
+    def _get_auction_token(self, token: str) -> Optional[AuctionToken]:
+        db = self._get_db()
+        try:
+            return (
+                db.query(AuctionToken)
+                .filter(AuctionToken.token == token)
+                .first()
+            )
+        finally:
+            db.close()
+
+    async def get_token(self, token: str) -> Optional[Token]:
+        token_info = await super().get_token(token)
+        if token_info:
+            return token_info
+
+        auction_token = await asyncio.to_thread(self._get_auction_token, token)
+        if not auction_token:
+            return None
+
+        return Token(
+            auction_id=str(auction_token.auction_id),
+            user_id=auction_token.user_id,
+            token=auction_token.token,
+            is_leader=auction_token.is_leader,
+        )
+
+    def _get_owner_address(self, auction_id: int) -> Optional[str]:
+        db = self._get_db()
+        try:
+            owner = db.get(AuctionOwner, auction_id)
+            if not owner or owner.address == self.address:
+                return None
+            return owner.address
+        finally:
+            db.close()
+
+    def _get_token_owner_address(self, token: str) -> Optional[str]:
+        db = self._get_db()
+        try:
+            owner = (
+                db.query(AuctionOwner)
+                .join(AuctionToken)
+                .filter(AuctionToken.token == token)
+                .first()
+            )
+            if not owner or owner.address == self.address:
+                return None
+            return owner.address
+        finally:
+            db.close()
+
+    async def get_auction_address(self, auction_id: str) -> Optional[str]:
+        if auction_id in self.auctions or not auction_id.isdigit():
+            return None
+
+        return await asyncio.to_thread(self._get_owner_address, int(auction_id))
+
+    async def get_remote_address(self, token: str) -> Optional[str]:
+        if token in self.token_to_auction:
+            return None
+
+        return await asyncio.to_thread(self._get_token_owner_address, token)
+
+    async def _handle_stream(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        from routers.auction_websocket_router import (
+            auction_spectator_session,
+            auction_websocket_session,
+        )
+
+        try:
+            handshake = await read_handshake(reader)
+        except Exception as e:
+            logger.warning(f"Invalid handshake: {e}")
+            writer.close()
+            return
+
+        if not handshake:
+            writer.close()
+            return
+
+        if "command" in handshake:
+            await self._run_command(handshake, writer)
+            return
+
+        websocket = StreamWebSocket(reader, writer)
+        protocol = handshake.get("protocol", JSON_PROTOCOL)
+        try:
+            if "auction_id" in handshake:
+                await auction_spectator_session(
+                    websocket,
+                    handshake["auction_id"],
+                    handshake.get("token", ""),
+                    handshake.get("last_seq"),
+                    protocol,
+                )
+            else:
+                await auction_websocket_session(
+                    websocket,
+                    handshake["token"],
+                    handshake.get("last_seq"),
+                    protocol,
+                )
+        except asyncio.CancelledError:
+            pass
+
+    async def _run_command(self, handshake: dict, writer: asyncio.StreamWriter):
+        command = handshake["command"]
+        handler = self.commands.get(command)
+        success = False
+        if handler and self.is_primary:
+            try:
+                result = handler(**handshake.get("data", {}))
+                if inspect.isawaitable(result):
+                    await result
+                success = True
+            except Exception as e:
+                logger.error(f"Command error: {command} - {e}")
+        else:
+            logger.warning(f"Command rejected: {command}")
+
+        try:
+            writer.write(json.dumps({"success": success}).encode() + b"\n")
+            await writer.drain()
+            writer.close()
+        except Exception:
+            pass
+
+    def _get_primary_lock_path(self):
+        return get_auction_socket_dir() / PRIMARY_LOCK
+
+    def _acquire_primary(self) -> bool:
+        lock = open(self._get_primary_lock_path(), "a+", encoding="utf-8")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+
+        lock.seek(0)
+        lock.truncate()
+        lock.write(self.address)
+        lock.flush()
+        self.primary_lock = lock
+        return True
+
+    def _get_primary_address(self) -> Optional[str]:
+        try:
+            address = self._get_primary_lock_path().read_text(encoding="utf-8")
+        except OSError:
+            return None
+        return address.strip() or None
+
+    def forward(self, command: str, data: Dict[str, Any]) -> bool:
+        if self.is_primary or not self.loop:
+            return False
+
+        future = asyncio.run_coroutine_threadsafe(
+            self.call_primary(command, data), self.loop
+        )
+        self.forwarded.add(future)
+        future.add_done_callback(self.forwarded.discard)
+        return True
+
+    async def call_primary(self, command: str, data: Dict[str, Any]) -> bool:
+        address = self._get_primary_address()
+        if not address:
+            logger.warning(f"Primary unknown: {command}")
+            return False
+
+        try:
+            reader, writer = await asyncio.open_unix_connection(address)
+            writer.write(
+                json.dumps({"command": command, "data": data}).encode() + b"\n"
+            )
+            await writer.drain()
+            reply = await reader.readline()
+            writer.close()
+        except OSError as e:
+            logger.warning(f"Primary unreachable: {address} - {e}")
+            return False
+
+        return bool(reply) and json.loads(reply).get("success", False)
+
+    async def start(self):
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        self.loop = asyncio.get_running_loop()
+        self.server = await asyncio.start_unix_server(
+            self._handle_stream, path=self.address
+        )
+        logger.info(f"Auction socket listening: {self.address}")
+
+        await self._remove_dead_owners()
+
+        if self._acquire_primary():
+            await self._elect()
+        else:
+            self.election_task = asyncio.create_task(self._retry_election())
+
+    async def _elect(self):
+        self.is_primary = True
+        logger.info(f"Elected primary worker: {self.address}")
+        await self._run_elected_handlers()
+
+    async def _retry_election(self):
+        try:
+            while not self._acquire_primary():
+                await asyncio.sleep(PRIMARY_RETRY_INTERVAL)
+        except asyncio.CancelledError:
+            return
+
+        await self._elect()
+
+    async def stop(self):
+        if self.election_task and not self.election_task.done():
+            self.election_task.cancel()
+        self.election_task = None
+
+        if self.server:
+            self.server.close()
+            self.server = None
+
+        if self.primary_lock:
+            self.primary_lock.close()
+            self.primary_lock = None
+            self.is_primary = False
+
+        await asyncio.to_thread(self._delete_owners, self.address)
+
+        if os.path.exists(self.address):
+            os.remove(self.address)
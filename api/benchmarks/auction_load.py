@@ -0,0 +1,396 @@
+import argparse
+import asyncio
+import os
+import random
+import resource
+import socket
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault(
+    "AUCTION_SNAPSHOT_PATH",
+    str(Path(tempfile.gettempdir()) / "auction_load_snapshots.jsonl"),
+)
+
+import uvicorn
+import websockets
+from fastapi import FastAPI
+
+from auction.auction_manager import auction_manager
+from dtos.auction_dto import Team
+from routers.auction_websocket_router import auction_websocket_router
+from utils.serializer import JSON_PROTOCOL, decode, encode, get_protocols
+from utils.websocket_compression import (
+    CompressedWebSocketProtocol,
+    compression_stats,
+)
+
+
+class Metrics:
+    def __init__(self):
+        self.bid_sent_at: Dict[Tuple[str, int, int], float] = {}
+        self.bid_latencies: List[float] = []
+        self.timer_drifts: List[float] = []
+        self.bids_sent = 0
+        self.bids_rejected = 0
+        self.frames = 0
+        self.frame_bytes = 0
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def get_rss_kb() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * resource.getpagesize() // 1024
+
+
+def get_peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(auction_websocket_router, prefix="/ws")
+    return app
+
+
+async def add_auctions(
+    auction_count: int,
+    leader_count: int,
+    spectator_count: int,
+    timer_duration: int,
+) -> List[Tuple[str, List[str], List[str]]]:
+    auctions = []
+    user_count = max(leader_count * 5, leader_count + spectator_count)
+
+    for preset_id in range(1, auction_count + 1):
+        user_ids = list(range(1, user_count + 1))
+        leader_ids = user_ids[:leader_count]
+        teams = [
+            Team(
+                team_id=idx + 1,
+                leader_id=leader_id,
+                member_id_list=[leader_id],
+                points=1000,
+            )
+            for idx, leader_id in enumerate(leader_ids)
+        ]
+
+        auction_id, user_tokens = await auction_manager.add_auction(
+            preset_id=preset_id,
+            teams=teams,
+            user_ids=user_ids,
+            leader_user_ids=set(leader_ids),
+            time=timer_duration,
+        )
+
+        leader_tokens = [user_tokens[user_id] for user_id in leader_ids]
+        spectator_tokens = [
+            user_tokens[user_id]
+            for user_id in user_ids[leader_count:][:spectator_count]
+        ]
+        auctions.append((auction_id, leader_tokens, spectator_tokens))
+
+    return auctions
+
+
+async def run_client(
+    url: str,
+    auction_id: str,
+    metrics: Metrics,
+    stop: asyncio.Event,
+    is_leader: bool,
+    measure_timer: bool,
+    bid_interval: float,
+    bids_per_user: int,
+    protocol: str,
+    compress: bool,
+    rng: random.Random,
+):
+    state = {
+        "status": None,
+        "team_id": None,
+        "current_user_id": None,
+        "current_bid": None,
+        "deadline": None,
+        "bids": 0,
+    }
+
+    async def bidder(ws):
+        while not stop.is_set():
+            await asyncio.sleep(rng.uniform(0.2, 1.0) * bid_interval)
+
+            if (
+                state["status"] != "in_progress"
+                or state["current_user_id"] is None
+                or state["bids"] >= bids_per_user
+            ):
+                continue
+
+            amount = (state["current_bid"] or 0) + rng.randint(1, 3)
+            metrics.bid_sent_at[(auction_id, state["team_id"], amount)] = (
+                time.perf_counter()
+            )
+            metrics.bids_sent += 1
+            state["bids"] += 1
+            try:
+                await ws.send(
+                    encode(
+                        {"type": "place_bid", "data": {"amount": amount}},
+                        protocol,
+                    )
+                )
+            except websockets.ConnectionClosed:
+                return
+
+    separator = "&" if "?" in url else "?"
+    async with websockets.connect(
+        f"{url}{separator}protocol={protocol}",
+        max_size=None,
+        compression="deflate" if compress else None,
+    ) as ws:
+        bidder_task = asyncio.create_task(bidder(ws)) if is_leader else None
+
+        try:
+            while not stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(ws.recv(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    continue
+
+                received_at = time.perf_counter()
+                metrics.frames += 1
+                metrics.frame_bytes += len(raw)
+
+                message = decode(raw, protocol)
+                message_type = message["type"]
+                data = message["data"]
+
+                if message_type == "init":
+                    state["status"] = data["status"]
+                    state["team_id"] = data["team_id"]
+                    state["current_user_id"] = data["current_user_id"]
+                    state["current_bid"] = data["current_bid"]
+                elif message_type == "status":
+                    state["status"] = data["status"]
+                elif message_type == "next_user":
+                    state["current_user_id"] = data["user_id"]
+                    state["current_bid"] = None
+                    state["bids"] = 0
+                elif message_type == "bid_placed":
+                    state["current_bid"] = data["amount"]
+                    sent_at = metrics.bid_sent_at.get(
+                        (auction_id, data["team_id"], data["amount"])
+                    )
+                    if sent_at is not None:
+                        metrics.bid_latencies.append(received_at - sent_at)
+                elif message_type == "error" and is_leader:
+                    metrics.bids_rejected += 1
+                elif message_type == "timer" and measure_timer:
+                    state["deadline"] = data["deadline"]
+                elif (
+                    message_type in ("user_sold", "user_unsold")
+                    and measure_timer
+                    and state["deadline"] is not None
+                ):
+                    metrics.timer_drifts.append(time.time() - state["deadline"])
+                    state["deadline"] = None
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            if bidder_task:
+                bidder_task.cancel()
+
+
+async def run(args: argparse.Namespace):
+    port = get_free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            ws=CompressedWebSocketProtocol,
+            ws_per_message_deflate=args.compress,
+        )
+    )
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    rng = random.Random(args.seed)
+    metrics = Metrics()
+    stop = asyncio.Event()
+
+    rss_before = get_rss_kb()
+    cpu_before = time.process_time()
+
+    auctions = await add_auctions(
+        args.auctions, args.leaders, args.spectators, args.time
+    )
+
+    clients = []
+    for auction_id, leader_tokens, spectator_tokens in auctions:
+        for idx, token in enumerate(leader_tokens):
+            clients.append(
+                run_client(
+                    f"ws://127.0.0.1:{port}/ws/auction/{token}",
+                    auction_id,
+                    metrics,
+                    stop,
+                    True,
+                    idx == 0,
+                    args.bid_interval,
+                    args.bids_per_user,
+                    args.protocol,
+                    args.compress,
+                    random.Random(rng.random()),
+                )
+            )
+        for token in spectator_tokens:
+            path = (
+                f"spectate/{auction_id}?token={token}"
+                if args.spectator_stream
+                else token
+            )
+            clients.append(
+                run_client(
+                    f"ws://127.0.0.1:{port}/ws/auction/{path}",
+                    auction_id,
+                    metrics,
+                    stop,
+                    False,
+                    False,
+                    args.bid_interval,
+                    args.bids_per_user,
+                    args.protocol,
+                    args.compress,
+                    rng,
+                )
+            )
+
+    client_tasks = [asyncio.create_task(client) for client in clients]
+    await asyncio.sleep(args.duration)
+    rss_after = get_rss_kb()
+    stop.set()
+    await asyncio.gather(*client_tasks, return_exceptions=True)
+
+    cpu_used = time.process_time() - cpu_before
+
+    for auction_id, _, _ in auctions:
+        auction = auction_manager.get_auction(auction_id)
+        if auction:
+            await auction.terminate_auction()
+            auction_manager.remove_auction(auction_id)
+
+    server.should_exit = True
+    await server_task
+
+    rss_kb = (
+        rss_after - rss_before
+        if rss_before is not None and rss_after is not None
+        else None
+    )
+    report(args, metrics, cpu_used, rss_kb)
+
+
+def report(
+    args: argparse.Namespace,
+    metrics: Metrics,
+    cpu_used: float,
+    rss_kb: Optional[int],
+):
+    connections = args.auctions * (args.leaders + args.spectators)
+    latencies = [latency * 1000 for latency in metrics.bid_latencies]
+    drifts = [drift * 1000 for drift in metrics.timer_drifts]
+
+    print(f"auctions:            {args.auctions}")
+    print(f"connections:         {connections}")
+    print(f"protocol:            {args.protocol}")
+    print(f"compression:         {args.compress}")
+    print(f"spectator stream:    {args.spectator_stream}")
+    print(f"duration:            {args.duration}s")
+    print(f"bids sent:           {metrics.bids_sent}")
+    print(f"bids rejected:       {metrics.bids_rejected}")
+    print(f"frames received:     {metrics.frames}")
+    print(f"bytes received:      {metrics.frame_bytes}")
+    print(
+        "bid latency ms:      "
+        f"p50={percentile(latencies, 50):.2f} "
+        f"p95={percentile(latencies, 95):.2f} "
+        f"p99={percentile(latencies, 99):.2f} "
+        f"max={max(latencies, default=0):.2f}"
+    )
+    print(
+        "timer drift ms:      "
+        f"p50={percentile(drifts, 50):.2f} "
+        f"p95={percentile(drifts, 95):.2f} "
+        f"max={max(drifts, default=0):.2f}"
+    )
+    print(
+        "compressed frames:   "
+        f"{compression_stats.compressed_frames} "
+        f"skipped={compression_stats.skipped_frames} "
+        f"ratio={compression_stats.get_ratio():.2f} "
+        f"cpu_ms={compression_stats.cpu_time * 1000:.2f}"
+    )
+    print(
+        f"cpu s:               total={cpu_used:.2f} "
+        f"per_auction={cpu_used / args.auctions:.3f}"
+    )
+    if rss_kb is None:
+        print("rss growth kb:       unavailable")
+    else:
+        print(
+            f"rss growth kb:       total={rss_kb} "
+            f"per_auction={rss_kb / args.auctions:.1f}"
+        )
+    print(f"peak rss kb:         {get_peak_rss_kb()}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Auction websocket load test (in-process server)"
+    )
+    parser.add_argument("--auctions", type=int, default=10)
+    parser.add_argument("--leaders", type=int, default=4)
+    parser.add_argument("--spectators", type=int, default=10)
+    parser.add_argument("--time", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--bid-interval", type=float, default=1.0)
+    parser.add_argument("--bids-per-user", type=int, default=2)
+    parser.add_argument(
+        "--protocol", choices=get_protocols(), default=JSON_PROTOCOL
+    )
+    parser.add_argument(
+        "--spectator-stream",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+    )
+    parser.add_argument(
+        "--compress", action=argparse.BooleanOptionalAction, default=True
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
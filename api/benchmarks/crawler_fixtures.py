@@ -0,0 +1,100 @@
+import argparse
+import sys
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from services.lol_service import parse_lol_html
+from services.val_service import parse_val_html
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+
+def read_fixture(name: str) -> str:
+    return (FIXTURE_DIR / name).read_text(encoding="utf-8")
+
+
+def check_lol_ranked() -> Optional[str]:
+    lol = parse_lol_html(read_fixture("lol_ranked.html"))
+    if lol is None:
+        return "no result"
+    if (lol.tier, lol.rank, lol.lp) != ("Emerald", "2", 63):
+        return f"tier {lol.tier} {lol.rank} {lol.lp}LP"
+    names = [champion.name for champion in lol.top_champions]
+    if names != ["아리", "오리아나", "신드라"]:
+        return f"champions {names}"
+    if [champion.games for champion in lol.top_champions] != [41, 25, 17]:
+        return "champion games"
+    return None
+
+
+def check_lol_unranked() -> Optional[str]:
+    lol = parse_lol_html(read_fixture("lol_unranked.html"))
+    if lol is None:
+        return "no result"
+    if (lol.tier, lol.rank, lol.lp) != ("Unranked", "", 0):
+        return f"tier {lol.tier} {lol.rank} {lol.lp}LP"
+    return None
+
+
+def check_lol_challenge() -> Optional[str]:
+    lol = parse_lol_html(read_fixture("lol_challenge.html"))
+    if lol is not None:
+        return f"parsed {lol.tier}, expected selenium fallback"
+    return None
+
+
+def check_val_ranked() -> Optional[str]:
+    val = parse_val_html(read_fixture("val_ranked.html"))
+    if val is None:
+        return "no result"
+    if (val.tier, val.rank) != ("Diamond", "2"):
+        return f"tier {val.tier} {val.rank}"
+    names = [agent.name for agent in val.top_agents]
+    if names != ["제트", "레이나"]:
+        return f"agents {names}"
+    if [agent.games for agent in val.top_agents] != [32, 14]:
+        return "agent games"
+    return None
+
+
+def check_val_challenge() -> Optional[str]:
+    val = parse_val_html(read_fixture("val_challenge.html"))
+    if val is not None:
+        return f"parsed {val.tier}, expected selenium fallback"
+    return None
+
+
+CHECKS: List[Callable[[], Optional[str]]] = [
+    check_lol_ranked,
+    check_lol_unranked,
+    check_lol_challenge,
+    check_val_ranked,
+    check_val_challenge,
+]
+
+
+def run(args: argparse.Namespace) -> int:
+    failed = 0
+    for check in CHECKS:
+        if args.only and args.only not in check.__name__:
+            continue
+        error = check()
+        if error:
+            failed += 1
+            print(f"FAIL {check.__name__}: {error}")
+        else:
+            print(f"ok   {check.__name__}")
+
+    return 1 if failed else 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Check the HTTP crawler parsers against saved pages"
+    )
+    parser.add_argument("--only", default="")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(run(parse_args()))
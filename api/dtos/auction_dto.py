@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
 
@@ -20,7 +20,10 @@ class MessageType(str, Enum):
     USER_UNSOLD = "user_unsold"
     NEXT_USER = "next_user"
     QUEUE_UPDATE = "queue_update"
+    QUEUE_DELTA = "queue_delta"
     INIT = "init"
+    GET_TEAMS = "get_teams"
+    TEAMS = "teams"
     STATUS = "status"
     ERROR = "error"
 
@@ -39,12 +42,37 @@ class AuctionStateDTO(BaseModel):
     current_user_id: Optional[int] = None
     current_bid: Optional[int] = None
     current_bidder: Optional[int] = None
-    timer: int
+    timer: float
     teams: List[Team]
+    team_seq: int
+    seq: int
     auction_queue: List[int]
     unsold_queue: List[int]
 
 
+class AuctionSnapshot(BaseModel):
+    auction_id: str
+    preset_id: int
+    status: AuctionStatus
+    teams: List[Team]
+    team_seq: int
+    seq: int
+    user_tokens: Dict[int, str]
+    auction_queue: List[int]
+    unsold_queue: List[int]
+    current_user_id: Optional[int] = None
+    current_bid: Optional[int] = None
+    current_bidder: Optional[int] = None
+    timer_duration: int
+    paused_timer: Optional[float] = None
+    was_in_progress: bool
+
+
+class AuctionSnapshotRecord(BaseModel):
+    auction_id: str
+    snapshot: Optional[AuctionSnapshot] = None
+
+
 class AuctionDTO(BaseModel):
     auction_id: str
     preset_id: int
@@ -55,7 +83,8 @@ class AddAuctionResponseDTO(BaseResponseDTO[AuctionDTO]):
 
 
 class TimerMessageData(BaseModel):
-    timer: int
+    timer: float
+    deadline: float
 
 
 class StatusMessageData(BaseModel):
@@ -71,7 +100,22 @@ class QueueUpdateMessageData(BaseModel):
     unsold_queue: List[int]
 
 
+class QueueDeltaMessageData(BaseModel):
+    unsold: Optional[int] = None
+    recycled: bool = False
+    popped: Optional[int] = None
+
+
 class UserSoldMessageData(BaseModel):
+    seq: int
+    team_id: int
+    user_id: int
+    price: int
+    points: int
+
+
+class TeamsMessageData(BaseModel):
+    seq: int
     teams: List[Team]
 
 
@@ -87,4 +131,4 @@ class ErrorMessageData(BaseModel):
 
 class WebSocketMessage(BaseModel):
     type: str
-    data: Dict
+    data: Any
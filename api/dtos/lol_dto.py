@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -20,4 +20,5 @@ class LolDto(BaseModel):
 
 
 class GetLolResponseDTO(BaseResponseDTO[LolDto]):
-    pass
+    age: Optional[float] = None
+    stale: bool = False
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -19,4 +19,5 @@ class ValDto(BaseModel):
 
 
 class GetValResponseDTO(BaseResponseDTO[ValDto]):
-    pass
+    age: Optional[float] = None
+    stale: bool = False
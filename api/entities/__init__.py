@@ -1,3 +1,6 @@
+from .auction_owner import AuctionOwner
+from .auction_token import AuctionToken
+from .crawl_result import CrawlResult
 from .position import Position
 from .preset import Preset
 from .preset_user import PresetUser
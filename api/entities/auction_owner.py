@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from utils.database import Base
+
+if TYPE_CHECKING:
+    from entities.auction_token import AuctionToken
+
+
+class AuctionOwner(Base):
+    __tablename__ = "auction_owner"
+
+    auction_id: Mapped[int] = mapped_column(
+        primary_key=True, autoincrement=True
+    )
+    address: Mapped[str] = mapped_column(String(1024), nullable=False)
+
+    auction_tokens: Mapped[List[AuctionToken]] = relationship(
+        "AuctionToken",
+        back_populates="auction_owner",
+        cascade="all, delete-orphan",
+    )
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Boolean, ForeignKey, String
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from utils.database import Base
+
+if TYPE_CHECKING:
+    from entities.auction_owner import AuctionOwner
+
+
+class AuctionToken(Base):
+    __tablename__ = "auction_token"
+
+    token: Mapped[str] = mapped_column(String(64), primary_key=True)
+    auction_id: Mapped[int] = mapped_column(
+        ForeignKey("auction_owner.auction_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[int] = mapped_column(nullable=False)
+    is_leader: Mapped[bool] = mapped_column(Boolean, nullable=False)
+
+    auction_owner: Mapped[AuctionOwner] = relationship(
+        "AuctionOwner", back_populates="auction_tokens"
+    )
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from sqlalchemy import Float, ForeignKey, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from utils.database import Base
+
+
+class CrawlResult(Base):
+    __tablename__ = "crawl_result"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.user_id", ondelete="CASCADE"), primary_key=True
+    )
+    lol: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    lol_fetched_at: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )
+    val: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    val_fetched_at: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )
@@ -23,6 +23,7 @@ from routers.preset_user_router import preset_user_router
 from routers.tier_router import tier_router
 from routers.user_router import user_router
 from routers.val_router import val_router
+from auction.auction_manager import auction_manager
 from services.discord_service import discord_service
 from services.crawler_service import crawler_service
 
@@ -49,6 +50,11 @@ def signal_handler(signum, frame):
     asyncio.set_event_loop(loop)
 
     try:
+        logger.info("Saving auction snapshots...")
+        if auction_manager.snapshot_store:
+            auction_manager.snapshot_store.flush_sync()
+        logger.info("Auction snapshots saved")
+
         logger.info("Stopping Discord service...")
         loop.run_until_complete(discord_service.stop())
         logger.info("Discord service stopped")
@@ -77,15 +83,48 @@ if sys.platform == "win32":
     signal.signal(signal.SIGBREAK, signal_handler)
 
 
+def register_primary_commands():
+    auction_manager.register_command(
+        "send_auction_urls", discord_service.send_auction_urls
+    )
+    auction_manager.register_command(
+        "download_profile", discord_service.download_profile
+    )
+    auction_manager.register_command(
+        "refresh_profile", discord_service.refresh_profile
+    )
+    auction_manager.register_command(
+        "invalidate_cache", crawler_service.invalidate_cache
+    )
+    auction_manager.register_command(
+        "prioritize_cache", crawler_service.prioritize_cache
+    )
+    auction_manager.register_command(
+        "remove_cache", crawler_service.remove_cache
+    )
+    auction_manager.register_command(
+        "crawl_on_demand", crawler_service.crawl_on_demand
+    )
+
+
+async def start_primary_services():
+    await crawler_service.start()
+    await discord_service.start()
+
+
 @asynccontextmanager
 async def lifespan(_):
     database.init_engine()
+    register_primary_commands()
+    auction_manager.register_elected_handler(start_primary_services)
+    await auction_manager.start()
 
-    await crawler_service.start()
-    await discord_service.start()
+    if not auction_manager.is_primary:
+        logger.info("Crawler and Discord bot run in the primary worker")
 
     yield
 
+    await auction_manager.stop()
     await discord_service.stop()
     await crawler_service.stop()
 
@@ -25,4 +25,4 @@ async def add_auction_route(
     _: dict = Depends(verify_admin_token),
 ) -> AddAuctionResponseDTO:
     logger.info(f"Adding auction: {preset_id}")
-    return add_auction_service(preset_id, db)
+    return await add_auction_service(preset_id, db)
@@ -1,5 +1,5 @@
-import json
 import logging
+from typing import Any, Optional, Tuple
 
 from fastapi import (
     APIRouter,
@@ -7,8 +7,17 @@ from fastapi import (
     WebSocketDisconnect,
 )
 
-from dtos.auction_dto import AuctionStatus, MessageType
+from auction.auction_manager import auction_manager
+from auction.auction_proxy import proxy_websocket
+from utils.serializer import (
+    JSON_PROTOCOL,
+    MSGPACK_PROTOCOL,
+    decode,
+    get_protocols,
+)
+from dtos.auction_dto import AuctionStatus, MessageType, WebSocketMessage
 from services.auction_websocket_service import (
+    handle_spectator_connect,
     handle_websocket_connect,
     handle_websocket_message,
     handle_websocket_disconnect,
@@ -21,39 +30,157 @@ auction_websocket_router = APIRouter(
 )
 
 
+def negotiate_protocol(
+    websocket: WebSocket, protocol: Optional[str]
+) -> Tuple[str, Optional[str]]:
+    protocols = get_protocols()
+    subprotocol = next(
+        (
+            name
+            for name in websocket.scope.get("subprotocols", [])
+            if name in protocols
+        ),
+        None,
+    )
+
+    if protocol in protocols:
+        return protocol, subprotocol
+
+    return subprotocol or JSON_PROTOCOL, subprotocol
+
+
+async def receive_message(websocket: WebSocket, protocol: str) -> Any:
+    if protocol == MSGPACK_PROTOCOL:
+        return decode(await websocket.receive_bytes(), protocol)
+
+    return decode(await websocket.receive_text(), protocol)
+
+
 @auction_websocket_router.websocket("/{token}")
-async def auction_websocket(websocket: WebSocket, token: str):
+async def auction_websocket(
+    websocket: WebSocket,
+    token: str,
+    last_seq: Optional[int] = None,
+    protocol: Optional[str] = None,
+):
     logger.info(f"Connection request: {token[:8]}...")
 
+    protocol, subprotocol = negotiate_protocol(websocket, protocol)
+
+    address = await auction_manager.get_remote_address(token)
+    if address:
+        logger.info(f"Proxying to owner: {address}")
+        if not await proxy_websocket(
+            websocket,
+            address,
+            {"token": token, "last_seq": last_seq},
+            protocol,
+            subprotocol,
+        ):
+            await auction_manager.remove_owner(address)
+        return
+
+    await auction_websocket_session(
+        websocket, token, last_seq, protocol, subprotocol
+    )
+
+
+@auction_websocket_router.websocket("/spectate/{auction_id}")
+async def auction_spectator_websocket(
+    websocket: WebSocket,
+    auction_id: str,
+    token: str = "",
+    last_seq: Optional[int] = None,
+    protocol: Optional[str] = None,
+):
+    logger.info(f"Spectator request: {auction_id}")
+
+    protocol, subprotocol = negotiate_protocol(websocket, protocol)
+
+    address = await auction_manager.get_auction_address(auction_id)
+    if address:
+        logger.info(f"Proxying spectator to owner: {address}")
+        if not await proxy_websocket(
+            websocket,
+            address,
+            {"auction_id": auction_id, "token": token, "last_seq": last_seq},
+            protocol,
+            subprotocol,
+        ):
+            await auction_manager.remove_owner(address)
+        return
+
+    await auction_spectator_session(
+        websocket, auction_id, token, last_seq, protocol, subprotocol
+    )
+
+
+async def auction_spectator_session(
+    websocket: WebSocket,
+    auction_id: str,
+    token: str,
+    last_seq: Optional[int] = None,
+    protocol: str = JSON_PROTOCOL,
+    subprotocol: Optional[str] = None,
+):
+    auction = await handle_spectator_connect(
+        websocket, auction_id, token, last_seq, protocol, subprotocol
+    )
+
+    if not auction:
+        return
+
+    try:
+        while True:
+            await receive_message(websocket, protocol)
+
+    except WebSocketDisconnect:
+        logger.info(f"Spectator disconnected: {auction_id}")
+
+    except Exception as e:
+        logger.error(f"Spectator error: {auction_id} - {e}")
+        await websocket.close()
+
+    finally:
+        auction.remove_spectator(websocket)
+
+
+async def auction_websocket_session(
+    websocket: WebSocket,
+    token: str,
+    last_seq: Optional[int] = None,
+    protocol: str = JSON_PROTOCOL,
+    subprotocol: Optional[str] = None,
+):
     auction, user_id, is_leader, team_id = await handle_websocket_connect(
-        websocket, token
+        websocket, token, protocol, subprotocol
     )
 
     if not auction:
         return
 
     try:
-        state = auction.get_state().model_dump()
-        init = {
-            **state,
-            "team_id": team_id,
-            "user_id": user_id,
-            "is_leader": is_leader,
-        }
-        await websocket.send_json(
-            {
-                "type": MessageType.INIT,
-                "data": init,
+        if last_seq is not None and auction.replay(websocket, last_seq):
+            logger.info(f"Resumed: {user_id} from {last_seq}")
+        else:
+            state = auction.get_state().model_dump()
+            init = {
+                **state,
+                "team_id": team_id,
+                "user_id": user_id,
+                "is_leader": is_leader,
             }
-        )
+            auction.send(
+                websocket,
+                WebSocketMessage(type=MessageType.INIT, data=init),
+            )
 
         if is_leader and auction.are_all_leaders_connected():
             if auction.status == AuctionStatus.WAITING:
                 await auction.set_status(AuctionStatus.IN_PROGRESS)
 
         while True:
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            message = await receive_message(websocket, protocol)
 
             await handle_websocket_message(
                 websocket, auction, token, message, is_leader
@@ -11,9 +11,9 @@ lol_router = APIRouter(prefix="/lol", tags=["lol"])
 
 
 @lol_router.get("/{user_id}", response_model=GetLolResponseDTO)
-async def get_lol_route(user_id: int):
+async def get_lol_route(user_id: int, wait: bool = False):
     logger.info(f"Fetching LOL: {user_id}")
-    result = await lol_service.get_lol(user_id)
+    result = await lol_service.get_lol(user_id, wait)
 
     if result is None:
         logger.warning(f"Not in cache: {user_id}")
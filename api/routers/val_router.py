@@ -11,9 +11,9 @@ val_router = APIRouter(prefix="/val", tags=["val"])
 
 
 @val_router.get("/{user_id}", response_model=GetValResponseDTO)
-async def get_val_route(user_id: int):
+async def get_val_route(user_id: int, wait: bool = False):
     logger.info(f"Fetching VAL: {user_id}")
-    result = await val_service.get_val(user_id)
+    result = await val_service.get_val(user_id, wait)
 
     if result is None:
         logger.warning(f"Not in cache: {user_id}")
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from sqlalchemy.orm import Session, joinedload
@@ -10,7 +11,7 @@ from dtos.auction_dto import (
 )
 from entities.preset import Preset
 from entities.preset_user import PresetUser
-from entities.user import User
+from services.crawler_service import crawler_service
 from services.discord_service import discord_service
 from utils.env import get_auction_url
 from utils.exception import CustomException, handle_exception
@@ -18,23 +19,29 @@ from utils.exception import CustomException, handle_exception
 logger = logging.getLogger(__name__)
 
 
-def add_auction_service(
+def _get_preset(preset_id: int, db: Session) -> Preset:
+    preset = (
+        db.query(Preset)
+        .options(
+            joinedload(Preset.preset_users).joinedload(PresetUser.user),
+        )
+        .filter(Preset.preset_id == preset_id)
+        .first()
+    )
+
+    if not preset:
+        logger.warning(f"Preset missing: {preset_id}")
+        raise CustomException(404, "Preset not found.")
+
+    return preset
+
+
+async def add_auction_service(
     preset_id: int, db: Session
 ) -> AddAuctionResponseDTO | None:
     try:
         logger.info(f"Adding: {preset_id}")
-        preset = (
-            db.query(Preset)
-            .options(
-                joinedload(Preset.preset_users).joinedload(PresetUser.user),
-            )
-            .filter(Preset.preset_id == preset_id)
-            .first()
-        )
-
-        if not preset:
-            logger.warning(f"Preset missing: {preset_id}")
-            raise CustomException(404, "Preset not found.")
+        preset = await asyncio.to_thread(_get_preset, preset_id, db)
 
         preset_users = preset.preset_users
         if not preset_users:
@@ -74,7 +81,7 @@ def add_auction_service(
 
         user_ids = [preset_user.user_id for preset_user in preset_users]
 
-        auction_id, user_tokens = auction_manager.add_auction(
+        auction_id, user_tokens = await auction_manager.add_auction(
             preset_id=preset_id,
             teams=teams,
             user_ids=user_ids,
@@ -83,15 +90,16 @@ def add_auction_service(
         )
 
         logger.info(f"Added: {auction_id}, users: {len(user_ids)}")
+        crawler_service.prioritize_cache(user_ids)
 
         invites = []
-        for user_id in user_ids:
-            if user_id in user_tokens:
-                token = user_tokens[user_id]
-                user = db.query(User).filter(User.user_id == user_id).first()
+        for preset_user in preset_users:
+            if preset_user.user_id in user_tokens:
+                token = user_tokens[preset_user.user_id]
+                user = preset_user.user
 
                 if not user:
-                    logger.warning(f"User missing: {user_id}")
+                    logger.warning(f"User missing: {preset_user.user_id}")
                     continue
 
                 auction_url = get_auction_url(token)
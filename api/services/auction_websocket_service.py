@@ -5,13 +5,22 @@ from fastapi import WebSocket
 
 from auction.auction import Auction
 from auction.auction_manager import auction_manager
-from dtos.auction_dto import MessageType, AuctionStatus
+from dtos.auction_dto import (
+    MessageType,
+    AuctionStatus,
+    ErrorMessageData,
+    WebSocketMessage,
+)
+from utils.serializer import JSON_PROTOCOL
 
 logger = logging.getLogger(__name__)
 
 
 async def handle_websocket_connect(
-    websocket: WebSocket, token: str
+    websocket: WebSocket,
+    token: str,
+    protocol: str = JSON_PROTOCOL,
+    subprotocol: Optional[str] = None,
 ) -> Tuple[Optional[Auction], Optional[int], bool, Optional[int]]:
     auction = auction_manager.get_auction_by_token(token)
 
@@ -20,7 +29,7 @@ async def handle_websocket_connect(
         await websocket.close(code=4004, reason="Auction not found")
         return None, None, False, None
 
-    token_info = auction_manager.get_token(token)
+    token_info = await auction_manager.get_token(token)
 
     if not token_info:
         logger.warning("Connection failed: Invalid token")
@@ -30,8 +39,8 @@ async def handle_websocket_connect(
     user_id = token_info.user_id
     is_leader = token_info.is_leader
 
-    await websocket.accept()
-    logger.info(f"Connected: {user_id}")
+    await websocket.accept(subprotocol=subprotocol)
+    logger.info(f"Connected: {user_id} ({protocol})")
 
     result = auction.connect(token)
 
@@ -44,11 +53,41 @@ async def handle_websocket_connect(
 
     team_id = result.get("team_id")
 
-    auction.add_connection(websocket)
+    auction.add_connection(websocket, protocol)
 
     return auction, user_id, is_leader, team_id
 
 
+async def handle_spectator_connect(
+    websocket: WebSocket,
+    auction_id: str,
+    token: str,
+    last_seq: Optional[int] = None,
+    protocol: str = JSON_PROTOCOL,
+    subprotocol: Optional[str] = None,
+) -> Optional[Auction]:
+    auction = auction_manager.get_auction(auction_id)
+
+    if not auction:
+        logger.warning("Spectator failed: Auction not found")
+        await websocket.close(code=4004, reason="Auction not found")
+        return None
+
+    token_info = await auction_manager.get_token(token)
+
+    if not token_info or token_info.auction_id != auction_id:
+        logger.warning("Spectator failed: Invalid token")
+        await websocket.close(code=4001, reason="Invalid token")
+        return None
+
+    await websocket.accept(subprotocol=subprotocol)
+    logger.info(f"Spectator connected: {auction_id} ({protocol})")
+
+    auction.add_spectator(websocket, protocol, last_seq)
+
+    return auction
+
+
 async def handle_websocket_message(
     websocket: WebSocket,
     auction: Auction,
@@ -58,41 +97,49 @@ async def handle_websocket_message(
 ) -> None:
     message_type = message.get("type")
 
+    if message_type == MessageType.GET_TEAMS.value:
+        auction.send(websocket, auction.get_teams_message())
+        return
+
     if message_type == MessageType.PLACE_BID.value:
         if not is_leader:
             logger.warning("Non-leader bid rejected")
-            await websocket.send_json(
-                {
-                    "type": MessageType.ERROR,
-                    "data": {"error": "Only leaders can place bids"},
-                }
+            auction.send(
+                websocket,
+                WebSocketMessage(
+                    type=MessageType.ERROR,
+                    data=ErrorMessageData(error="Only leaders can place bids"),
+                ),
             )
             return
 
-        bid_data = message.get("data", {})
-        amount = bid_data.get("amount")
+        bid_data = message.get("data")
+        amount = bid_data.get("amount") if isinstance(bid_data, dict) else None
 
         if amount is None:
             logger.warning("Bid without amount")
-            await websocket.send_json(
-                {
-                    "type": MessageType.ERROR,
-                    "data": {"error": "Amount required"},
-                }
+            auction.send(
+                websocket,
+                WebSocketMessage(
+                    type=MessageType.ERROR,
+                    data=ErrorMessageData(error="Amount required"),
+                ),
             )
             return
 
-        logger.info(f"Placing bid: {amount}")
-        bid_result = await auction.place_bid(token, amount)
-
-        if not bid_result.get("success"):
-            logger.warning(f"Bid failed: {bid_result.get('error')}")
-            await websocket.send_json(
-                {
-                    "type": MessageType.ERROR,
-                    "data": {"error": bid_result.get("error", "Bid failed")},
-                }
+        if not isinstance(amount, int) or isinstance(amount, bool):
+            logger.warning(f"Bid amount invalid: {amount!r}")
+            auction.send(
+                websocket,
+                WebSocketMessage(
+                    type=MessageType.ERROR,
+                    data=ErrorMessageData(error="Amount must be an integer"),
+                ),
             )
+            return
+
+        logger.info(f"Placing bid: {amount}")
+        await auction.submit_bid(websocket, token, amount)
 
 
 async def handle_websocket_disconnect(
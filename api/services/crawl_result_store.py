@@ -0,0 +1,56 @@
+import logging
+from typing import Optional
+
+from entities.crawl_result import CrawlResult
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlResultStore:
+    def _get_db(self):
+        from utils.database import get_db
+
+        return next(get_db())
+
+    def load(self, user_id: int) -> Optional[CrawlResult]:
+        db = self._get_db()
+        try:
+            return db.get(CrawlResult, user_id)
+        finally:
+            db.close()
+
+    def save(
+        self,
+        user_id: int,
+        lol: Optional[str],
+        lol_fetched_at: Optional[float],
+        val: Optional[str],
+        val_fetched_at: Optional[float],
+    ):
+        db = self._get_db()
+        try:
+            db.merge(
+                CrawlResult(
+                    user_id=user_id,
+                    lol=lol,
+                    lol_fetched_at=lol_fetched_at,
+                    val=val,
+                    val_fetched_at=val_fetched_at,
+                )
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def remove(self, user_id: int):
+        db = self._get_db()
+        try:
+            db.query(CrawlResult).filter(
+                CrawlResult.user_id == user_id
+            ).delete()
+            db.commit()
+        finally:
+            db.close()
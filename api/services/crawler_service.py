@@ -2,16 +2,32 @@ import asyncio
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Generic, Iterable, List, Optional, Set, TypeVar
 
+import aiohttp
 from selenium import webdriver
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
-from dtos.lol_dto import GetLolResponseDTO
-from dtos.val_dto import GetValResponseDTO
-from utils.crawler import get_chrome_options
+from dtos.lol_dto import GetLolResponseDTO, LolDto
+from dtos.val_dto import GetValResponseDTO, ValDto
+from entities.crawl_result import CrawlResult
+from services.crawl_result_store import CrawlResultStore
+from utils.crawler import DriverPool, create_http_session, get_chrome_options
+from utils.env import (
+    get_crawler_on_demand_timeout,
+    get_crawler_workers,
+    get_lol_crawler_backend,
+    get_val_crawler_backend,
+)
+from utils.refresh_scheduler import (
+    AUCTION_PRIORITY,
+    INVALIDATE_PRIORITY,
+    ON_DEMAND_PRIORITY,
+    REFRESH_PRIORITY,
+    RefreshScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,43 +36,140 @@ WEB_DRIVER_TIMEOUT = 20
 PAGE_LOAD_TIMEOUT = 5
 SCRIPT_TIMEOUT = 5
 AUTO_REFRESH_INTERVAL = 1800
+CACHE_TTL = AUTO_REFRESH_INTERVAL
+CACHE_EXPIRY = 7 * 24 * 3600
+ON_DEMAND_COOLDOWN = 300
+
+HTTP_BACKEND = "http"
+SELENIUM_BACKEND = "selenium"
+
+
+T = TypeVar("T")
+
+
+class CacheEntry(Generic[T]):
+    def __init__(
+        self,
+        value: T,
+        fetched_at: float,
+        ttl: float = CACHE_TTL,
+        expiry: float = CACHE_EXPIRY,
+    ):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+        self.expiry = expiry
+
+    def get_age(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+    def is_stale(self) -> bool:
+        return self.get_age() > self.ttl
+
+    def is_expired(self) -> bool:
+        return self.get_age() > self.expiry
 
 
 class Cache:
     def __init__(self):
-        self.lol: Optional[GetLolResponseDTO] = None
-        self.val: Optional[GetValResponseDTO] = None
+        self.lol: Optional[CacheEntry[LolDto]] = None
+        self.val: Optional[CacheEntry[ValDto]] = None
+
+    def get_refresh_at(self) -> float:
+        if not self.lol or not self.val:
+            return 0.0
+
+        return min(
+            self.lol.fetched_at + self.lol.ttl,
+            self.val.fetched_at + self.val.ttl,
+        )
+
+
+def get_cache(result: CrawlResult) -> Cache:
+    cache = Cache()
+    if result.lol:
+        cache.lol = CacheEntry(
+            LolDto.model_validate_json(result.lol), result.lol_fetched_at
+        )
+    if result.val:
+        cache.val = CacheEntry(
+            ValDto.model_validate_json(result.val), result.val_fetched_at
+        )
+    return cache
+
+
+def get_lol_response(entry: CacheEntry[LolDto]) -> GetLolResponseDTO:
+    return GetLolResponseDTO(
+        success=True,
+        code=200,
+        message="LOL info retrieved successfully.",
+        data=entry.value,
+        age=entry.get_age(),
+        stale=entry.is_stale(),
+    )
+
+
+def get_val_response(entry: CacheEntry[ValDto]) -> GetValResponseDTO:
+    return GetValResponseDTO(
+        success=True,
+        code=200,
+        message="VAL info retrieved successfully.",
+        data=entry.value,
+        age=entry.get_age(),
+        stale=entry.is_stale(),
+    )
 
 
 class CrawlerService:
     def __init__(self):
         self._cache: Dict[int, Cache] = {}
+        self._loaded: Set[int] = set()
+        self._loading: Dict[int, Future] = {}
+        self._loading_lock = threading.Lock()
+        self._failed_at: Dict[int, float] = {}
+        self._store = CrawlResultStore()
         self._ready = False
 
-        self._refresh_queue: Optional[asyncio.Queue[int]] = None
-        self._handle_queue_task: Optional[asyncio.Task] = None
+        self._scheduler: Optional[RefreshScheduler] = None
+        self._workers = get_crawler_workers()
+        self._on_demand_timeout = get_crawler_on_demand_timeout()
+        self._handle_queue_tasks: List[asyncio.Task] = []
         self._auto_refresh_task: Optional[asyncio.Task] = None
 
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
         self._executor: Optional[ThreadPoolExecutor] = None
         self._chrome_service: Optional[Service] = None
+        self._driver_pool: Optional[DriverPool] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._lol_backend = get_lol_crawler_backend()
+        self._val_backend = get_val_crawler_backend()
 
     def _init(self):
         self._loop = asyncio.new_event_loop()
         asyncio.set_event_loop(self._loop)
         self._executor = ThreadPoolExecutor(
-            max_workers=2, thread_name_prefix="Crawler"
+            max_workers=self._workers * 2, thread_name_prefix="Crawler"
         )
 
         try:
             self._chrome_service = Service(ChromeDriverManager().install())
             logger.info("ChromeDriver initialized")
 
-            self._refresh_queue = asyncio.Queue()
-            self._handle_queue_task = self._loop.create_task(
-                self._handle_queue()
+            self._driver_pool = DriverPool(
+                self._create_driver, size=self._workers * 2
             )
+            self._executor.submit(self._driver_pool.warm)
+
+            self._http_session = self._loop.run_until_complete(
+                create_http_session()
+            )
+
+            self._scheduler = RefreshScheduler()
+            self._handle_queue_tasks = [
+                self._loop.create_task(self._handle_queue(worker_id))
+                for worker_id in range(self._workers)
+            ]
             self._auto_refresh_task = self._loop.create_task(
                 self._auto_refresh()
             )
@@ -80,13 +193,24 @@ class CrawlerService:
                 except Exception as e:
                     logger.error(f"Executor shutdown error: {e}")
 
+            if self._driver_pool:
+                self._driver_pool.close()
+                logger.info("Driver pool closed")
+
+            if self._http_session:
+                try:
+                    self._loop.run_until_complete(self._http_session.close())
+                    logger.info("HTTP session closed")
+                except Exception as e:
+                    logger.error(f"HTTP session close error: {e}")
+
             try:
                 self._loop.close()
                 logger.info("Loop closed")
             except Exception as e:
                 logger.error(f"Loop close error: {e}")
 
-    def _create_driver(self, user_id: int) -> webdriver.Chrome:
+    def _create_driver(self) -> webdriver.Chrome:
         chrome_options = get_chrome_options()
         chrome_options.page_load_strategy = "eager"
         driver = webdriver.Chrome(
@@ -98,17 +222,9 @@ class CrawlerService:
         driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
         driver.set_script_timeout(SCRIPT_TIMEOUT)
         driver.implicitly_wait(0)
-        logger.info(f"Driver created for user {user_id}")
+        logger.info("Driver created")
         return driver
 
-    def _close_driver(self, driver: Optional[webdriver.Chrome], user_id: int):
-        if driver:
-            try:
-                driver.quit()
-                logger.info(f"Driver closed for user {user_id}")
-            except Exception as e:
-                logger.error(f"Driver quit error: {e}")
-
     def _crawl(
         self,
         user_id: int,
@@ -116,13 +232,40 @@ class CrawlerService:
         tag_line: str,
         crawl_func,
     ):
-        driver = None
-        try:
-            driver = self._create_driver(user_id)
-            result = crawl_func(driver, game_name, tag_line)
-            return result
-        finally:
-            self._close_driver(driver, user_id)
+        with self._driver_pool.acquire() as driver:
+            logger.info(f"Driver acquired for user {user_id}")
+            return crawl_func(driver, game_name, tag_line)
+
+    async def _fetch(
+        self,
+        user_id: int,
+        game_name: str,
+        tag_line: str,
+        backend: str,
+        fetch_func,
+        crawl_func,
+    ):
+        if backend == HTTP_BACKEND and self._http_session:
+            try:
+                result = await fetch_func(
+                    self._http_session, game_name, tag_line
+                )
+                if result:
+                    return result
+                logger.info(f"HTTP parse failed, using browser: {user_id}")
+            except Exception as e:
+                logger.warning(
+                    f"HTTP fetch failed, using browser: {user_id} - {type(e).__name__}"
+                )
+
+        return await self._loop.run_in_executor(
+            self._executor,
+            self._crawl,
+            user_id,
+            game_name,
+            tag_line,
+            crawl_func,
+        )
 
     async def _refresh_cache(self, user_id: int):
         if not self._ready:
@@ -140,120 +283,240 @@ class CrawlerService:
             if not user:
                 logger.error(f"User not found: {user_id}")
                 self.remove_cache(user_id)
+                self._failed_at[user_id] = time.time()
                 return
 
             if not user.riot_id or "#" not in user.riot_id:
                 self.remove_cache(user_id)
+                self._failed_at[user_id] = time.time()
                 return
 
             game_name, tag_line = user.riot_id.split("#", 1)
         except Exception as e:
+            self._failed_at[user_id] = time.time()
             return
 
+        await self._load_cache(user_id)
+
         if not self._executor:
             logger.error(f"Executor not ready: {user_id}")
             return
 
         from services import lol_service, val_service
 
-        lol_future = self._executor.submit(
-            self._crawl,
-            user_id,
-            game_name,
-            tag_line,
-            lol_service.crawl_lol,
+        lol_result, val_result = await asyncio.gather(
+            self._fetch(
+                user_id,
+                game_name,
+                tag_line,
+                self._lol_backend,
+                lol_service.fetch_lol,
+                lol_service.crawl_lol,
+            ),
+            self._fetch(
+                user_id,
+                game_name,
+                tag_line,
+                self._val_backend,
+                val_service.fetch_val,
+                val_service.crawl_val,
+            ),
+            return_exceptions=True,
         )
 
-        try:
-            lol_dto = lol_future.result()
+        if isinstance(lol_result, Exception):
+            logger.error(
+                f"LOL failed: {user_id} - {type(lol_result).__name__}: {str(lol_result)}"
+            )
+            if user_id in self._cache and self._cache[user_id].lol:
+                logger.info(f"LOL cache kept: {user_id}")
+        else:
             if user_id not in self._cache:
                 self._cache[user_id] = Cache()
-            self._cache[user_id].lol = GetLolResponseDTO(
-                success=True,
-                code=200,
-                message="LOL info retrieved successfully.",
-                data=lol_dto,
-            )
+            self._cache[user_id].lol = CacheEntry(lol_result, time.time())
             logger.info(f"LOL cached: {user_id}")
-        except Exception as e:
+
+        if isinstance(val_result, Exception):
             logger.error(
-                f"LOL failed: {user_id} - {type(e).__name__}: {str(e)}"
+                f"VAL failed: {user_id} - {type(val_result).__name__}: {str(val_result)}"
             )
-            if user_id in self._cache and self._cache[user_id].lol:
-                self._cache[user_id].lol = None
-                logger.info(f"LOL cache deleted: {user_id}")
-
-        val_future = self._executor.submit(
-            self._crawl,
-            user_id,
-            game_name,
-            tag_line,
-            val_service.crawl_val,
-        )
-
-        try:
-            val_dto = val_future.result()
+            if user_id in self._cache and self._cache[user_id].val:
+                logger.info(f"VAL cache kept: {user_id}")
+        else:
             if user_id not in self._cache:
                 self._cache[user_id] = Cache()
-            self._cache[user_id].val = GetValResponseDTO(
-                success=True,
-                code=200,
-                message="VAL info retrieved successfully.",
-                data=val_dto,
-            )
+            self._cache[user_id].val = CacheEntry(val_result, time.time())
             logger.info(f"VAL cached: {user_id}")
+
+        if isinstance(lol_result, Exception) or isinstance(
+            val_result, Exception
+        ):
+            self._failed_at[user_id] = time.time()
+        else:
+            self._failed_at.pop(user_id, None)
+
+        await self._save_cache(user_id)
+
+        logger.info(f"Finished: {user_id}")
+
+    def _is_primary(self) -> bool:
+        from auction.auction_manager import auction_manager
+
+        return auction_manager.is_primary
+
+    def _forward(self, command: str, **data) -> bool:
+        from auction.auction_manager import auction_manager
+
+        return auction_manager.forward(command, data)
+
+    async def _read_cache(self, user_id: int) -> Optional[Cache]:
+        try:
+            result = await asyncio.to_thread(self._store.load, user_id)
         except Exception as e:
-            logger.error(
-                f"VAL failed: {user_id} - {type(e).__name__}: {str(e)}"
+            logger.error(f"Cache load error: {user_id} - {e}")
+            return None
+
+        return get_cache(result) if result else None
+
+    async def _load_cache(self, user_id: int) -> Optional[Cache]:
+        if user_id in self._loaded:
+            return self._cache.get(user_id)
+
+        with self._loading_lock:
+            future = self._loading.get(user_id)
+            is_loader = future is None
+            if is_loader:
+                future = Future()
+                self._loading[user_id] = future
+
+        if not is_loader:
+            await asyncio.wrap_future(future)
+            return self._cache.get(user_id)
+
+        try:
+            cache = await self._read_cache(user_id)
+            if cache and user_id not in self._cache:
+                self._cache[user_id] = cache
+                logger.info(f"Cache loaded: {user_id}")
+        finally:
+            self._loaded.add(user_id)
+            with self._loading_lock:
+                del self._loading[user_id]
+            future.set_result(None)
+
+        return self._cache.get(user_id)
+
+    async def _get_cache(self, user_id: int) -> Optional[Cache]:
+        if self._is_primary():
+            return await self._load_cache(user_id)
+
+        return await self._read_cache(user_id)
+
+    async def _save_cache(self, user_id: int):
+        cache = self._cache.get(user_id)
+        if not cache:
+            return
+
+        try:
+            await asyncio.to_thread(
+                self._store.save,
+                user_id,
+                cache.lol.value.model_dump_json() if cache.lol else None,
+                cache.lol.fetched_at if cache.lol else None,
+                cache.val.value.model_dump_json() if cache.val else None,
+                cache.val.fetched_at if cache.val else None,
             )
-            if user_id in self._cache and self._cache[user_id].val:
-                self._cache[user_id].val = None
-                logger.info(f"VAL cache deleted: {user_id}")
+        except Exception as e:
+            logger.error(f"Cache save error: {user_id} - {e}")
 
-        logger.info(f"Finished: {user_id}")
+    async def _delete_cache(self, user_id: int):
+        try:
+            await asyncio.to_thread(self._store.remove, user_id)
+        except Exception as e:
+            logger.error(f"Cache delete error: {user_id} - {e}")
 
-    async def _handle_queue(self):
-        logger.info("Queue started")
+    async def _handle_queue(self, worker_id: int):
+        logger.info(f"Queue worker {worker_id} started")
 
         while self._ready:
             try:
-                user_id = await self._refresh_queue.get()
+                user_id = await self._scheduler.get()
 
                 if not self._ready:
                     break
 
-                logger.info(f"Processing: {user_id}")
-                await self._refresh_cache(user_id)
-                self._refresh_queue.task_done()
+                logger.info(f"Processing: {user_id} (worker {worker_id})")
+                try:
+                    await self._refresh_cache(user_id)
+                finally:
+                    self._scheduler.complete(user_id)
 
             except asyncio.CancelledError:
-                logger.info("Queue cancelled")
+                logger.info(f"Queue worker {worker_id} cancelled")
                 break
             except Exception as e:
                 logger.error(f"Queue error: {e}")
 
+    def _get_refresh_user_ids(self) -> List[int]:
+        from entities.user import User
+        from utils.database import get_db
+
+        db = next(get_db())
+        try:
+            users = db.query(User).filter(User.riot_id.isnot(None)).all()
+            return [
+                user.user_id
+                for user in users
+                if user.riot_id and "#" in user.riot_id
+            ]
+        finally:
+            db.close()
+
+    async def _get_refresh_at(self, user_id: int) -> float:
+        cache = await self._load_cache(user_id)
+        if not cache:
+            return 0.0
+        return cache.get_refresh_at()
+
+    async def _schedule_refresh(self):
+        user_ids = await asyncio.to_thread(self._get_refresh_user_ids)
+
+        now = time.time()
+        user_count = 0
+        pending = []
+        for user_id in user_ids:
+            refresh_at = await self._get_refresh_at(user_id)
+            if not refresh_at:
+                if self._scheduler.schedule(user_id, now, REFRESH_PRIORITY):
+                    user_count += 1
+                continue
+            pending.append((refresh_at, user_id))
+        pending.sort()
+
+        spacing = AUTO_REFRESH_INTERVAL / max(len(pending), 1)
+        for idx, (refresh_at, user_id) in enumerate(pending):
+            due = max(refresh_at, now + idx * spacing)
+            if self._scheduler.schedule(user_id, due, REFRESH_PRIORITY):
+                user_count += 1
+
+        logger.info(f"Scheduled {user_count} users over {spacing:.1f}s slots")
+
+    async def _prioritize(self, user_ids: Iterable[int]):
+        user_count = 0
+        for user_id in user_ids:
+            refresh_at = await self._get_refresh_at(user_id)
+            if self._scheduler.schedule(user_id, refresh_at, AUCTION_PRIORITY):
+                user_count += 1
+
+        logger.info(f"Prioritized {user_count} users")
+
     async def _auto_refresh(self):
         logger.info("Auto refresh started")
 
         while self._ready:
             try:
-                logger.info("Adding users to queue")
-
-                from entities.user import User
-                from utils.database import get_db
-
-                db = next(get_db())
-                users = db.query(User).filter(User.riot_id.isnot(None)).all()
-
-                user_count = 0
-                for user in users:
-                    if user.riot_id and "#" in user.riot_id:
-                        self._refresh_queue.put_nowait(user.user_id)
-                        user_count += 1
-
-                db.close()
-                logger.info(f"Added {user_count} users to queue")
-
+                logger.info("Scheduling users")
+                await self._schedule_refresh()
                 await asyncio.sleep(AUTO_REFRESH_INTERVAL)
 
             except asyncio.CancelledError:
@@ -285,10 +548,10 @@ class CrawlerService:
                 self._ready = False
 
                 if self._loop.is_running():
-                    if self._handle_queue_task:
+                    for task in self._handle_queue_tasks:
                         try:
                             asyncio.run_coroutine_threadsafe(
-                                self._cancel_task(self._handle_queue_task),
+                                self._cancel_task(task),
                                 self._loop,
                             ).result(timeout=5.0)
                             logger.info("Queue task cancelled")
@@ -329,8 +592,41 @@ class CrawlerService:
         except asyncio.CancelledError:
             pass
 
-    def invalidate_cache(self, user_id: int):
-        if not self._ready or not self._refresh_queue:
+    async def _request_refresh(self, user_id: int, due: float, priority: int):
+        if self._scheduler.schedule(user_id, due, priority):
+            logger.info(f"Queued: {user_id}")
+        elif self._scheduler.is_in_flight(user_id):
+            logger.info(f"Joined in-flight: {user_id}")
+        else:
+            logger.info(f"Joined queued: {user_id}")
+
+        future = self._scheduler.wait(user_id)
+        if future:
+            await asyncio.shield(future)
+
+    def invalidate_cache(self, user_id: int) -> Optional[Future]:
+        if self._forward("invalidate_cache", user_id=user_id):
+            return None
+
+        if not self._ready or self._scheduler is None:
+            logger.error("Not ready")
+            return None
+
+        if not self._loop or not self._loop.is_running():
+            logger.error("Loop not running")
+            return None
+
+        return asyncio.run_coroutine_threadsafe(
+            self._request_refresh(user_id, time.time(), INVALIDATE_PRIORITY),
+            self._loop,
+        )
+
+    def prioritize_cache(self, user_ids: Iterable[int]):
+        user_ids = list(user_ids)
+        if self._forward("prioritize_cache", user_ids=user_ids):
+            return
+
+        if not self._ready or self._scheduler is None:
             logger.error("Not ready")
             return
 
@@ -338,34 +634,113 @@ class CrawlerService:
             logger.error("Loop not running")
             return
 
-        def _put_in_queue():
+        asyncio.run_coroutine_threadsafe(self._prioritize(user_ids), self._loop)
+
+    async def crawl_on_demand(self, user_id: int):
+        if self._on_demand_timeout <= 0:
+            return
+
+        if not self._is_primary():
+            from auction.auction_manager import auction_manager
+
             try:
-                self._refresh_queue.put_nowait(user_id)
-                logger.info(f"Queued: {user_id}")
-            except asyncio.QueueFull:
-                logger.warning(f"Queue full, cannot add: {user_id}")
-            except Exception as e:
-                logger.error(f"Failed to queue {user_id}: {e}")
+                await asyncio.wait_for(
+                    auction_manager.call_primary(
+                        "crawl_on_demand", {"user_id": user_id}
+                    ),
+                    self._on_demand_timeout,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"On-demand crawl timeout: {user_id}")
+            return
+
+        if not self._ready or self._scheduler is None:
+            logger.warning(f"Not ready for on-demand crawl: {user_id}")
+            return
+
+        failed_at = self._failed_at.get(user_id)
+        if failed_at and time.time() - failed_at < ON_DEMAND_COOLDOWN:
+            logger.info(f"On-demand crawl cooling down: {user_id}")
+            return
+
+        if not self._loop or not self._loop.is_running():
+            logger.warning(f"Loop not running for on-demand crawl: {user_id}")
+            return
 
-        self._loop.call_soon_threadsafe(_put_in_queue)
+        future = asyncio.run_coroutine_threadsafe(
+            self._request_refresh(user_id, 0.0, ON_DEMAND_PRIORITY),
+            self._loop,
+        )
+        try:
+            await asyncio.wait_for(
+                asyncio.wrap_future(future), self._on_demand_timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"On-demand crawl timeout: {user_id}")
 
     def remove_cache(self, user_id: int):
+        if self._forward("remove_cache", user_id=user_id):
+            return
+
+        self._loaded.add(user_id)
+
         if user_id in self._cache:
             del self._cache[user_id]
             logger.info(f"Cache removed: {user_id}")
 
-    async def get_lol(self, user_id: int) -> Optional[GetLolResponseDTO]:
-        if user_id in self._cache and self._cache[user_id].lol:
+        if self._loop and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                self._delete_cache(user_id), self._loop
+            )
+
+    async def _get_lol_entry(
+        self, user_id: int
+    ) -> Optional[CacheEntry[LolDto]]:
+        cache = await self._get_cache(user_id)
+        if cache and cache.lol and cache.lol.is_expired():
+            cache.lol = None
+            logger.info(f"LOL expired: {user_id}")
+
+        return cache.lol if cache else None
+
+    async def _get_val_entry(
+        self, user_id: int
+    ) -> Optional[CacheEntry[ValDto]]:
+        cache = await self._get_cache(user_id)
+        if cache and cache.val and cache.val.is_expired():
+            cache.val = None
+            logger.info(f"VAL expired: {user_id}")
+
+        return cache.val if cache else None
+
+    async def get_lol(
+        self, user_id: int, wait: bool = False
+    ) -> Optional[GetLolResponseDTO]:
+        entry = await self._get_lol_entry(user_id)
+        if not entry and wait:
+            logger.info(f"LOL miss, crawling: {user_id}")
+            await self.crawl_on_demand(user_id)
+            entry = await self._get_lol_entry(user_id)
+
+        if entry:
             logger.debug(f"LOL hit: {user_id}")
-            return self._cache[user_id].lol
+            return get_lol_response(entry)
 
         logger.debug(f"LOL miss: {user_id}")
         return None
 
-    async def get_val(self, user_id: int) -> Optional[GetValResponseDTO]:
-        if user_id in self._cache and self._cache[user_id].val:
+    async def get_val(
+        self, user_id: int, wait: bool = False
+    ) -> Optional[GetValResponseDTO]:
+        entry = await self._get_val_entry(user_id)
+        if not entry and wait:
+            logger.info(f"VAL miss, crawling: {user_id}")
+            await self.crawl_on_demand(user_id)
+            entry = await self._get_val_entry(user_id)
+
+        if entry:
             logger.debug(f"VAL hit: {user_id}")
-            return self._cache[user_id].val
+            return get_val_response(entry)
 
         logger.debug(f"VAL miss: {user_id}")
         return None
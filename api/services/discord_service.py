@@ -144,7 +144,15 @@ class DiscordBotService:
 
                 logger.error(traceback.format_exc())
 
+    def _forward(self, command: str, **data) -> bool:
+        from auction.auction_manager import auction_manager
+
+        return auction_manager.forward(command, data)
+
     def send_auction_urls(self, invites: list[tuple[str, str]]) -> None:
+        if self._forward("send_auction_urls", invites=invites):
+            return
+
         if not self.bot or not self._ready:
             logger.error("Not ready")
             return 0
@@ -225,19 +233,22 @@ class DiscordBotService:
         if not discord_id or not discord_id.strip():
             return None
 
-        if not self.bot or not self._ready:
-            logger.error("Not ready")
-            return None
-
         profile_path = get_profile_path(discord_id)
 
         if profile_path.exists():
             return get_profile_url(discord_id)
 
-        self._schedule_profile_download(discord_id)
+        self.download_profile(discord_id)
         return None
 
-    def _schedule_profile_download(self, discord_id: str) -> None:
+    def download_profile(self, discord_id: str) -> None:
+        if self._forward("download_profile", discord_id=discord_id):
+            return
+
+        if not self.bot or not self._ready:
+            logger.error("Not ready")
+            return
+
         if not self._loop or not self._loop.is_running():
             logger.error("Loop not running")
             return
@@ -281,6 +292,9 @@ class DiscordBotService:
         if not discord_id or not discord_id.strip():
             return
 
+        if self._forward("refresh_profile", discord_id=discord_id):
+            return
+
         if not self._loop or not self._loop.is_running():
             logger.error("Loop not running")
             return
@@ -294,7 +308,7 @@ class DiscordBotService:
             except Exception as e:
                 logger.warning(f"Failed to delete old profile: {e}")
 
-        self._schedule_profile_download(discord_id)
+        self.download_profile(discord_id)
 
     def remove_profile(self, discord_id: str) -> None:
         if not discord_id or not discord_id.strip():
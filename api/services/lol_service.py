@@ -1,7 +1,8 @@
 import logging
 import re
-from typing import Optional
+from typing import Optional, Tuple
 
+import aiohttp
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
@@ -10,15 +11,125 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from dtos.lol_dto import GetLolResponseDTO, LolDto, ChampionDto
 from services.crawler_service import crawler_service, WEB_DRIVER_TIMEOUT
+from utils.crawler import fetch_html, parse_html, parse_win_rate
 
 logger = logging.getLogger(__name__)
 
+TIER_SELECTORS = [
+    "strong.text-xl.first-letter\\:uppercase",
+    "strong[class*='text-xl']",
+    "div[class*='TierRankInfo'] strong",
+    "strong",
+]
+HTTP_TIER_SELECTORS = [
+    "strong.text-xl.first-letter\\:uppercase",
+    "strong[class*='text-xl']",
+    "div[class*='TierRankInfo'] strong",
+]
+LP_SELECTOR = "span.text-xs.text-gray-500"
+CHAMPION_SELECTOR = "li.box-border.flex.w-full.items-center.border-b"
+CHAMPION_IMG_SELECTOR = "img.rounded-full"
+WIN_RATE_SELECTOR = "div.flex.basis-\\[92px\\].flex-col.text-right"
+
+
+def get_lol_url(game_name: str, tag_line: str) -> str:
+    encoded_name = game_name.replace(" ", "%20")
+    return f"https://op.gg/ko/lol/summoners/kr/{encoded_name}-{tag_line}?queue_type=SOLORANKED"
+
+
+def match_tier(tier_text: str) -> Optional[Tuple[str, str]]:
+    tier_pattern = r"(Unranked|Iron|Bronze|Silver|Gold|Platinum|Emerald|Diamond|Master|Grandmaster|Challenger)(?:\s+(I|II|III|IV|1|2|3|4))?"
+    tier_match = re.search(tier_pattern, tier_text, re.IGNORECASE)
+
+    if tier_match:
+        tier = tier_match.group(1).capitalize()
+        rank = tier_match.group(2) if tier_match.group(2) else ""
+        return tier, rank
+
+    return None
+
+
+def parse_tier(tier_text: str) -> Tuple[str, str]:
+    return match_tier(tier_text) or ("Unranked", "")
+
+
+def parse_lp(lp_text: str) -> int:
+    lp_match = re.search(r"(\d+)\s*LP", lp_text)
+    return int(lp_match.group(1)) if lp_match else 0
+
+
+def parse_games(games_text: str) -> int:
+    games_match = re.search(r"(\d+)\s*게임", games_text)
+    return int(games_match.group(1)) if games_match else 0
+
+
+def parse_lol_html(html: str) -> Optional[LolDto]:
+    tree = parse_html(html)
+    if tree is None:
+        return None
+
+    tier_match = None
+    for selector in HTTP_TIER_SELECTORS:
+        tier_node = tree.css_first(selector)
+        if tier_node:
+            tier_match = match_tier(tier_node.text(strip=True))
+        if tier_match:
+            break
+
+    if not tier_match:
+        return None
+
+    tier, rank = tier_match
+    lp_node = tree.css_first(LP_SELECTOR)
+    lp = parse_lp(lp_node.text(strip=True)) if lp_node else 0
+
+    top_champions = []
+    for champ_node in tree.css(CHAMPION_SELECTOR)[:3]:
+        champ_img = champ_node.css_first(CHAMPION_IMG_SELECTOR)
+        win_rate_container = champ_node.css_first(WIN_RATE_SELECTOR)
+        if not champ_img or not win_rate_container:
+            continue
+
+        wr_node = win_rate_container.css_first("span.text-xs")
+        games_node = win_rate_container.css_first("span.text-2xs")
+        try:
+            win_rate = parse_win_rate(wr_node.text() if wr_node else "")
+        except ValueError:
+            continue
+
+        name = champ_img.attributes.get("alt") or "Unknown"
+        games = parse_games(games_node.text() if games_node else "")
+
+        if name != "Unknown" and games > 0:
+            top_champions.append(
+                ChampionDto(
+                    name=name,
+                    icon_url=champ_img.attributes.get("src") or "",
+                    games=games,
+                    win_rate=win_rate,
+                )
+            )
+
+    return LolDto(
+        tier=tier,
+        rank=rank,
+        lp=lp,
+        top_champions=top_champions,
+    )
+
+
+async def fetch_lol(
+    session: aiohttp.ClientSession, game_name: str, tag_line: str
+) -> Optional[LolDto]:
+    url = get_lol_url(game_name, tag_line)
+    logger.info(f"Fetching: {url}")
+    return parse_lol_html(await fetch_html(session, url))
+
 
 def crawl_lol(
     driver: webdriver.Chrome, game_name: str, tag_line: str
 ) -> LolDto:
-    encoded_name = game_name.replace(" ", "%20")
-    url = f"https://op.gg/ko/lol/summoners/kr/{encoded_name}-{tag_line}?queue_type=SOLORANKED"
+    url = get_lol_url(game_name, tag_line)
 
     tier = "Unranked"
     rank = ""
@@ -49,14 +160,7 @@ def crawl_lol(
     try:
         wait = WebDriverWait(driver, WEB_DRIVER_TIMEOUT)
         tier_element = None
-        tier_selectors = [
-            "strong.text-xl.first-letter\\:uppercase",
-            "strong[class*='text-xl']",
-            "div[class*='TierRankInfo'] strong",
-            "strong",
-        ]
-
-        for selector in tier_selectors:
+        for selector in TIER_SELECTORS:
             try:
                 tier_element = wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -67,25 +171,11 @@ def crawl_lol(
                 continue
 
         if tier_element:
-            tier_text = tier_element.text.strip()
-
-            tier_pattern = r"(Unranked|Iron|Bronze|Silver|Gold|Platinum|Emerald|Diamond|Master|Grandmaster|Challenger)(?:\s+(I|II|III|IV|1|2|3|4))?"
-            tier_match = re.search(tier_pattern, tier_text, re.IGNORECASE)
-
-            if tier_match:
-                tier = tier_match.group(1).capitalize()
-                rank = tier_match.group(2) if tier_match.group(2) else ""
-            else:
-                tier = "Unranked"
-                rank = ""
+            tier, rank = parse_tier(tier_element.text.strip())
 
             try:
-                lp_span = driver.find_element(
-                    By.CSS_SELECTOR, "span.text-xs.text-gray-500"
-                )
-                lp_text = lp_span.text.strip()
-                lp_match = re.search(r"(\d+)\s*LP", lp_text)
-                lp = int(lp_match.group(1)) if lp_match else 0
+                lp_span = driver.find_element(By.CSS_SELECTOR, LP_SELECTOR)
+                lp = parse_lp(lp_span.text.strip())
             except:
                 lp = 0
         else:
@@ -101,16 +191,11 @@ def crawl_lol(
         wait = WebDriverWait(driver, WEB_DRIVER_TIMEOUT)
 
         wait.until(
-            EC.presence_of_element_located(
-                (
-                    By.CSS_SELECTOR,
-                    "li.box-border.flex.w-full.items-center.border-b",
-                )
-            )
+            EC.presence_of_element_located((By.CSS_SELECTOR, CHAMPION_SELECTOR))
         )
 
         champ_elements = driver.find_elements(
-            By.CSS_SELECTOR, "li.box-border.flex.w-full.items-center.border-b"
+            By.CSS_SELECTOR, CHAMPION_SELECTOR
         )
 
         for champ_element in champ_elements[:3]:
@@ -121,27 +206,23 @@ def crawl_lol(
                 win_rate = 0.0
 
                 champ_img = champ_element.find_element(
-                    By.CSS_SELECTOR, "img.rounded-full"
+                    By.CSS_SELECTOR, CHAMPION_IMG_SELECTOR
                 )
                 name = champ_img.get_attribute("alt") or "Unknown"
                 icon_url = champ_img.get_attribute("src") or ""
 
                 win_rate_container = champ_element.find_element(
-                    By.CSS_SELECTOR,
-                    "div.flex.basis-\\[92px\\].flex-col.text-right",
+                    By.CSS_SELECTOR, WIN_RATE_SELECTOR
                 )
                 wr_span = win_rate_container.find_element(
                     By.CSS_SELECTOR, "span.text-xs"
                 )
-                wr_text = wr_span.text.strip().replace("%", "")
-                win_rate = float(wr_text) if wr_text and wr_text != "" else 0.0
+                win_rate = parse_win_rate(wr_span.text)
 
                 games_span = win_rate_container.find_element(
                     By.CSS_SELECTOR, "span.text-2xs"
                 )
-                games_text = games_span.text.strip()
-                games_match = re.search(r"(\d+)\s*게임", games_text)
-                games = int(games_match.group(1)) if games_match else 0
+                games = parse_games(games_span.text.strip())
 
                 if name != "Unknown" and games > 0:
                     top_champions.append(
@@ -168,5 +249,7 @@ def crawl_lol(
     )
 
 
-async def get_lol(user_id: int) -> Optional[GetLolResponseDTO]:
-    return await crawler_service.get_lol(user_id)
+async def get_lol(
+    user_id: int, wait: bool = False
+) -> Optional[GetLolResponseDTO]:
+    return await crawler_service.get_lol(user_id, wait)
@@ -1,7 +1,8 @@
 import logging
 import re
-from typing import Optional
+from typing import Optional, Tuple
 
+import aiohttp
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
@@ -10,15 +11,142 @@ from selenium.webdriver.support.ui import WebDriverWait
 
 from dtos.val_dto import GetValResponseDTO, ValDto, AgentDto
 from services.crawler_service import crawler_service, WEB_DRIVER_TIMEOUT
+from utils.crawler import fetch_html, parse_html, parse_win_rate
 
 logger = logging.getLogger(__name__)
 
+TIER_SELECTORS = [
+    "div.text-\\[14px\\].font-bold.md\\:text-\\[20px\\]",
+    "div[class*='font-bold'][class*='text-']",
+    "div.font-bold",
+]
+HTTP_TIER_SELECTORS = [
+    "div.text-\\[14px\\].font-bold.md\\:text-\\[20px\\]",
+]
+AGENT_SELECTOR = "li.box-border.flex.h-\\[50px\\].w-full"
+AGENT_IMG_SELECTOR = "img[alt='agent image']"
+AGENT_NAME_SELECTOR = "div.text-\\[12px\\].font-bold"
+WIN_RATE_SELECTOR = "div.flex.flex-col.items-end"
+WIN_RATE_SPAN_SELECTOR = "span.text-\\[12px\\]"
+
+TIER_MAP = {
+    "언랭크": "Unranked",
+    "아이언": "Iron",
+    "브론즈": "Bronze",
+    "실버": "Silver",
+    "골드": "Gold",
+    "플래티넘": "Platinum",
+    "다이아몬드": "Diamond",
+    "초월자": "Ascendant",
+    "불멸": "Immortal",
+    "레디언트": "Radiant",
+}
+
+
+def get_val_url(game_name: str, tag_line: str) -> str:
+    encoded_name = game_name.replace(" ", "%20")
+    return f"https://op.gg/ko/valorant/profile/{encoded_name}-{tag_line}?statQueueId=competitive"
+
+
+def match_tier(tier_text: str) -> Optional[Tuple[str, str]]:
+    tier_kr_pattern = r"(언랭크|아이언|브론즈|실버|골드|플래티넘|다이아몬드|초월자|불멸|레디언트)(?:\s+(1|2|3))?"
+    tier_kr_match = re.search(tier_kr_pattern, tier_text)
+
+    if tier_kr_match:
+        tier_kr = tier_kr_match.group(1)
+        rank = tier_kr_match.group(2) if tier_kr_match.group(2) else ""
+        return TIER_MAP.get(tier_kr, "Unranked"), rank
+
+    tier_en_pattern = r"(Unranked|Iron|Bronze|Silver|Gold|Platinum|Diamond|Ascendant|Immortal|Radiant)(?:\s+(1|2|3))?"
+    tier_en_match = re.search(tier_en_pattern, tier_text, re.IGNORECASE)
+
+    if tier_en_match:
+        tier = tier_en_match.group(1).capitalize()
+        rank = tier_en_match.group(2) if tier_en_match.group(2) else ""
+        return tier, rank
+
+    return None
+
+
+def parse_tier(tier_text: str) -> Tuple[str, str]:
+    return match_tier(tier_text) or ("Unranked", "")
+
+
+def parse_matches(agent_text: str) -> int:
+    games_match = re.search(r"(\d+)\s*매치", agent_text)
+    return int(games_match.group(1)) if games_match else 0
+
+
+def parse_val_html(html: str) -> Optional[ValDto]:
+    tree = parse_html(html)
+    if tree is None:
+        return None
+
+    tier_match = None
+    for selector in HTTP_TIER_SELECTORS:
+        tier_node = tree.css_first(selector)
+        if tier_node:
+            tier_match = match_tier(tier_node.text(strip=True))
+        if tier_match:
+            break
+
+    if not tier_match:
+        return None
+
+    tier, rank = tier_match
+
+    top_agents = []
+    for agent_node in tree.css(AGENT_SELECTOR)[:3]:
+        agent_text = agent_node.text(separator="\n")
+        agent_img = agent_node.css_first(AGENT_IMG_SELECTOR)
+        name_node = agent_node.css_first(AGENT_NAME_SELECTOR)
+        win_rate_container = agent_node.css_first(WIN_RATE_SELECTOR)
+        wr_node = (
+            win_rate_container.css_first(WIN_RATE_SPAN_SELECTOR)
+            if win_rate_container
+            else None
+        )
+
+        if not agent_img or not name_node or not wr_node:
+            continue
+
+        try:
+            win_rate = parse_win_rate(wr_node.text())
+        except ValueError:
+            continue
+
+        name = name_node.text(strip=True)
+        games = parse_matches(agent_text)
+
+        if name and (games > 0 or win_rate > 0):
+            top_agents.append(
+                AgentDto(
+                    name=name,
+                    icon_url=agent_img.attributes.get("src") or "",
+                    games=games,
+                    win_rate=win_rate,
+                )
+            )
+
+    return ValDto(
+        tier=tier,
+        rank=rank,
+        top_agents=top_agents,
+    )
+
+
+async def fetch_val(
+    session: aiohttp.ClientSession, game_name: str, tag_line: str
+) -> Optional[ValDto]:
+    url = get_val_url(game_name, tag_line)
+    logger.info(f"Fetching: {url}")
+    return parse_val_html(await fetch_html(session, url))
+
 
 def crawl_val(
     driver: webdriver.Chrome, game_name: str, tag_line: str
 ) -> ValDto:
-    encoded_name = game_name.replace(" ", "%20")
-    url = f"https://op.gg/ko/valorant/profile/{encoded_name}-{tag_line}?statQueueId=competitive"
+    url = get_val_url(game_name, tag_line)
 
     tier = "Unranked"
     rank = ""
@@ -46,13 +174,7 @@ def crawl_val(
     try:
         wait = WebDriverWait(driver, WEB_DRIVER_TIMEOUT)
         tier_element = None
-        tier_selectors = [
-            "div.text-\\[14px\\].font-bold.md\\:text-\\[20px\\]",
-            "div[class*='font-bold'][class*='text-']",
-            "div.font-bold",
-        ]
-
-        for selector in tier_selectors:
+        for selector in TIER_SELECTORS:
             try:
                 tier_element = wait.until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
@@ -63,42 +185,7 @@ def crawl_val(
                 continue
 
         if tier_element:
-            tier_text = tier_element.text.strip()
-
-            tier_kr_pattern = r"(언랭크|아이언|브론즈|실버|골드|플래티넘|다이아몬드|초월자|불멸|레디언트)(?:\s+(1|2|3))?"
-            tier_kr_match = re.search(tier_kr_pattern, tier_text)
-
-            if tier_kr_match:
-                tier_kr = tier_kr_match.group(1)
-                rank = tier_kr_match.group(2) if tier_kr_match.group(2) else ""
-
-                tier_map = {
-                    "언랭크": "Unranked",
-                    "아이언": "Iron",
-                    "브론즈": "Bronze",
-                    "실버": "Silver",
-                    "골드": "Gold",
-                    "플래티넘": "Platinum",
-                    "다이아몬드": "Diamond",
-                    "초월자": "Ascendant",
-                    "불멸": "Immortal",
-                    "레디언트": "Radiant",
-                }
-                tier = tier_map.get(tier_kr, "Unranked")
-            else:
-                tier_en_pattern = r"(Unranked|Iron|Bronze|Silver|Gold|Platinum|Diamond|Ascendant|Immortal|Radiant)(?:\s+(1|2|3))?"
-                tier_en_match = re.search(
-                    tier_en_pattern, tier_text, re.IGNORECASE
-                )
-
-                if tier_en_match:
-                    tier = tier_en_match.group(1).capitalize()
-                    rank = (
-                        tier_en_match.group(2) if tier_en_match.group(2) else ""
-                    )
-                else:
-                    tier = "Unranked"
-                    rank = ""
+            tier, rank = parse_tier(tier_element.text.strip())
         else:
             tier = "Unranked"
             rank = ""
@@ -111,14 +198,10 @@ def crawl_val(
         wait = WebDriverWait(driver, WEB_DRIVER_TIMEOUT)
 
         wait.until(
-            EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "li.box-border.flex.h-\\[50px\\].w-full")
-            )
+            EC.presence_of_element_located((By.CSS_SELECTOR, AGENT_SELECTOR))
         )
 
-        agent_elements = driver.find_elements(
-            By.CSS_SELECTOR, "li.box-border.flex.h-\\[50px\\].w-full"
-        )
+        agent_elements = driver.find_elements(By.CSS_SELECTOR, AGENT_SELECTOR)
 
         for agent_element in agent_elements[:3]:
             try:
@@ -131,33 +214,28 @@ def crawl_val(
 
                 try:
                     agent_img = agent_element.find_element(
-                        By.CSS_SELECTOR, "img[alt='agent image']"
+                        By.CSS_SELECTOR, AGENT_IMG_SELECTOR
                     )
                     icon_url = agent_img.get_attribute("src") or ""
 
                     name_div = agent_element.find_element(
-                        By.CSS_SELECTOR, "div.text-\\[12px\\].font-bold"
+                        By.CSS_SELECTOR, AGENT_NAME_SELECTOR
                     )
                     name = name_div.text.strip()
 
                     win_rate_container = agent_element.find_element(
-                        By.CSS_SELECTOR, "div.flex.flex-col.items-end"
+                        By.CSS_SELECTOR, WIN_RATE_SELECTOR
                     )
                     wr_span = win_rate_container.find_element(
-                        By.CSS_SELECTOR, "span.text-\\[12px\\]"
-                    )
-                    wr_text = wr_span.text.strip().replace("%", "")
-                    win_rate = (
-                        float(wr_text) if wr_text and wr_text != "" else 0.0
+                        By.CSS_SELECTOR, WIN_RATE_SPAN_SELECTOR
                     )
+                    win_rate = parse_win_rate(wr_span.text)
                 except:
                     wr_match = re.search(r"(\d+(?:\.\d+)?)%", agent_text)
                     if wr_match:
                         win_rate = float(wr_match.group(1))
 
-                games_match = re.search(r"(\d+)\s*매치", agent_text)
-                if games_match:
-                    games = int(games_match.group(1))
+                games = parse_matches(agent_text)
 
                 if name != "Unknown" and (games > 0 or win_rate > 0):
                     top_agents.append(
@@ -182,5 +260,7 @@ def crawl_val(
     )
 
 
-async def get_val(user_id: int) -> Optional[GetValResponseDTO]:
-    return await crawler_service.get_val(user_id)
+async def get_val(
+    user_id: int, wait: bool = False
+) -> Optional[GetValResponseDTO]:
+    return await crawler_service.get_val(user_id, wait)
@@ -1,14 +1,31 @@
 import logging
+import threading
 import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional
 
+import aiohttp
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+DRIVER_POOL_SIZE = 2
+DRIVER_MAX_USES = 50
+HTTP_POOL_SIZE = 8
+HTTP_TIMEOUT = 10
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
 
 def get_chrome_options() -> Options:
     chrome_options = Options()
@@ -28,11 +45,199 @@ def get_chrome_options() -> Options:
     chrome_options.add_argument(
         "--disable-features=IsolateOrigins,site-per-process"
     )
-    chrome_options.add_argument(
-        "user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
     chrome_options.add_experimental_option(
         "excludeSwitches", ["enable-automation"]
     )
     chrome_options.add_experimental_option("useAutomationExtension", False)
     return chrome_options
+
+
+async def create_http_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "ko-KR,ko;q=0.9",
+        },
+    )
+
+
+async def fetch_html(session: aiohttp.ClientSession, url: str) -> str:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.text()
+
+
+def parse_html(html: str) -> Optional["LexborHTMLParser"]:
+    if LexborHTMLParser is None:
+        return None
+    return LexborHTMLParser(html)
+
+
+def parse_win_rate(wr_text: str) -> float:
+    wr_text = wr_text.strip().replace("%", "")
+    return float(wr_text) if wr_text else 0.0
+
+
+class PooledDriver:
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    def __init__(
+        self,
+        create_driver: Callable[[], webdriver.Chrome],
+        size: int = DRIVER_POOL_SIZE,
+        max_uses: int = DRIVER_MAX_USES,
+    ):
+        self.create_driver = create_driver
+        self.size = size
+        self.max_uses = max_uses
+        self.idle: List[PooledDriver] = []
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        self.available = threading.Condition(self.lock)
+        self.created = 0
+        self.closed = False
+
+    def warm(self):
+        while True:
+            with self.available:
+                if self.closed or self.created >= self.size:
+                    return
+                self.created += 1
+
+            try:
+                pooled = self._create()
+            except Exception as e:
+                logger.error(f"Driver warm error: {e}")
+                return
+            self._release(pooled)
+
+    def _create(self) -> PooledDriver:
+        try:
+            return PooledDriver(self.create_driver())
+        except Exception:
+            with self.available:
+                self.created -= 1
+                self.available.notify()
+            raise
+
+    @contextmanager
+    def acquire(self) -> Iterator[webdriver.Chrome]:
+        if self.closed:
+            raise RuntimeError("Driver pool closed")
+
+        self.slots.acquire()
+        pooled = None
+        try:
+            pooled = self._take()
+            yield pooled.driver
+        except WebDriverException as e:
+            if pooled and not isinstance(e, TimeoutException):
+                logger.warning(f"Driver error, recycling: {type(e).__name__}")
+                self._quit(pooled)
+                pooled = None
+            raise
+        finally:
+            if pooled:
+                pooled.uses += 1
+                self._release(pooled)
+            self.slots.release()
+
+    def _take(self) -> PooledDriver:
+        while True:
+            with self.available:
+                while (
+                    not self.closed
+                    and not self.idle
+                    and self.created >= self.size
+                ):
+                    self.available.wait()
+
+                if self.closed:
+                    raise RuntimeError("Driver pool closed")
+
+                pooled = self.idle.pop() if self.idle else None
+                if pooled is None:
+                    self.created += 1
+
+            if pooled is None:
+                pooled = self._create()
+                if self.closed:
+                    self._quit(pooled)
+                    raise RuntimeError("Driver pool closed")
+                return pooled
+
+            if self._is_healthy(pooled):
+                return pooled
+
+            logger.warning("Driver unhealthy, recycling")
+            self._quit(pooled)
+
+    def _release(self, pooled: PooledDriver):
+        if self.closed or pooled.uses >= self.max_uses:
+            self._quit(pooled)
+            return
+
+        try:
+            self._reset(pooled.driver)
+        except Exception as e:
+            logger.warning(f"Driver reset error: {type(e).__name__}")
+            self._quit(pooled)
+            return
+
+        with self.available:
+            if len(self.idle) < self.size:
+                self.idle.append(pooled)
+                self.available.notify()
+                return
+
+        self._quit(pooled)
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        try:
+            return len(pooled.driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _reset(self, driver: webdriver.Chrome):
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        try:
+            driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except Exception:
+            pass
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.get("about:blank")
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+            logger.info(f"Driver closed after {pooled.uses} uses")
+        except Exception as e:
+            logger.error(f"Driver quit error: {e}")
+
+        with self.available:
+            self.created -= 1
+            self.available.notify()
+
+    def close(self):
+        with self.available:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.available.notify_all()
+
+        for pooled in idle:
+            self._quit(pooled)
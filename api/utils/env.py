@@ -37,6 +37,44 @@ def get_profile_path(discord_id: str) -> Path:
     return get_profile_dir() / f"{discord_id}.png"
 
 
+def get_auction_snapshot_path() -> Path:
+    return Path(os.getenv("AUCTION_SNAPSHOT_PATH", "auction_snapshots.jsonl"))
+
+
+def get_auction_store() -> str:
+    return os.getenv("AUCTION_STORE", "memory")
+
+
+def get_auction_socket_dir() -> Path:
+    socket_dir = Path(tempfile.gettempdir()) / "trader-auction"
+    socket_dir.mkdir(exist_ok=True)
+    return socket_dir
+
+
+def get_bid_window() -> float:
+    return float(os.getenv("BID_WINDOW", "0.2"))
+
+
+def get_ws_compression_threshold() -> int:
+    return int(os.getenv("WS_COMPRESSION_THRESHOLD", "512"))
+
+
+def get_crawler_workers() -> int:
+    return max(1, int(os.getenv("CRAWLER_WORKERS", "2")))
+
+
+def get_crawler_on_demand_timeout() -> float:
+    return float(os.getenv("CRAWLER_ON_DEMAND_TIMEOUT", "10"))
+
+
+def get_lol_crawler_backend() -> str:
+    return os.getenv("LOL_CRAWLER_BACKEND", "selenium")
+
+
+def get_val_crawler_backend() -> str:
+    return os.getenv("VAL_CRAWLER_BACKEND", "selenium")
+
+
 def get_admin_password() -> str:
     return os.getenv("ADMIN_PASSWORD", "admin")
 
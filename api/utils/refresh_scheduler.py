@@ -0,0 +1,118 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+INVALIDATE_PRIORITY = 0
+ON_DEMAND_PRIORITY = 1
+AUCTION_PRIORITY = 2
+REFRESH_PRIORITY = 3
+
+
+class RefreshScheduler:
+    def __init__(self):
+        self._heap: List[Tuple[float, int, int, int]] = []
+        self._ready: List[Tuple[int, float, int, int]] = []
+        self._entries: Dict[int, Tuple[float, int]] = {}
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._in_flight: Dict[int, Optional[asyncio.Future]] = {}
+        self._deferred: Set[int] = set()
+        self._counter = itertools.count()
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._entries
+
+    def is_in_flight(self, user_id: int) -> bool:
+        return user_id in self._in_flight
+
+    def schedule(self, user_id: int, due: float, priority: int) -> bool:
+        if user_id in self._in_flight and priority > INVALIDATE_PRIORITY:
+            return False
+
+        current = self._entries.get(user_id)
+        if current is not None:
+            due, priority = min(current[0], due), min(current[1], priority)
+            if current == (due, priority):
+                return False
+
+        self._entries[user_id] = (due, priority)
+        heapq.heappush(
+            self._heap, (due, priority, next(self._counter), user_id)
+        )
+        self._changed.set()
+        return True
+
+    def wait(self, user_id: int) -> Optional[asyncio.Future]:
+        if user_id in self._entries:
+            if user_id not in self._pending:
+                self._pending[user_id] = (
+                    asyncio.get_running_loop().create_future()
+                )
+            return self._pending[user_id]
+
+        if user_id in self._in_flight:
+            if self._in_flight[user_id] is None:
+                self._in_flight[user_id] = (
+                    asyncio.get_running_loop().create_future()
+                )
+            return self._in_flight[user_id]
+
+        return None
+
+    def complete(self, user_id: int):
+        future = self._in_flight.pop(user_id, None)
+        if future and not future.done():
+            future.set_result(None)
+
+        if user_id in self._deferred:
+            self._deferred.discard(user_id)
+            due, priority = self._entries[user_id]
+            heapq.heappush(
+                self._heap, (due, priority, next(self._counter), user_id)
+            )
+            self._changed.set()
+
+    def _is_current(self, user_id: int, due: float, priority: int) -> bool:
+        return self._entries.get(user_id) == (due, priority)
+
+    def _collect_due(self) -> Optional[float]:
+        now = time.time()
+        while self._heap:
+            due, priority, count, user_id = self._heap[0]
+            if not self._is_current(user_id, due, priority):
+                heapq.heappop(self._heap)
+            elif due <= now:
+                heapq.heappop(self._heap)
+                heapq.heappush(self._ready, (priority, due, count, user_id))
+            else:
+                return due - now
+
+        return None
+
+    async def get(self) -> int:
+        while True:
+            timeout = self._collect_due()
+
+            while self._ready:
+                priority, due, _, user_id = heapq.heappop(self._ready)
+                if not self._is_current(user_id, due, priority):
+                    continue
+
+                if user_id in self._in_flight:
+                    self._deferred.add(user_id)
+                    continue
+
+                del self._entries[user_id]
+                self._in_flight[user_id] = self._pending.pop(user_id, None)
+                return user_id
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
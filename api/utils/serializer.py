@@ -0,0 +1,62 @@
+import json
+from typing import Any, List, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+JSON_PROTOCOL = "json"
+MSGPACK_PROTOCOL = "msgpack"
+
+Frame = Union[str, bytes]
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default).decode()
+
+    return json.dumps(
+        obj, default=_default, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def get_protocols() -> List[str]:
+    if msgpack is not None:
+        return [JSON_PROTOCOL, MSGPACK_PROTOCOL]
+
+    return [JSON_PROTOCOL]
+
+
+def encode(obj: Any, protocol: str = JSON_PROTOCOL) -> Frame:
+    if protocol == MSGPACK_PROTOCOL:
+        return msgpack.packb(obj, default=_default)
+
+    return dumps(obj)
+
+
+def decode(data: Frame, protocol: str = JSON_PROTOCOL) -> Any:
+    if protocol == MSGPACK_PROTOCOL:
+        return msgpack.unpackb(data)
+
+    return loads(data)
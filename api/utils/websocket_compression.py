@@ -0,0 +1,104 @@
+import time
+from typing import Any, List, Sequence, Tuple
+
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+from websockets.frames import CTRL_OPCODES, Frame, Opcode
+
+from utils.env import get_ws_compression_threshold
+
+try:
+    from uvicorn.protocols.websockets.websockets_sansio_impl import (
+        WebSocketsSansIOProtocol,
+    )
+except ImportError:
+    WebSocketsSansIOProtocol = None
+
+
+class CompressionStats:
+    def __init__(self):
+        self.compressed_frames = 0
+        self.skipped_frames = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.cpu_time = 0.0
+
+    def get_ratio(self) -> float:
+        if not self.raw_bytes:
+            return 1.0
+        return self.compressed_bytes / self.raw_bytes
+
+
+compression_stats = CompressionStats()
+
+
+class ThresholdPerMessageDeflate(PerMessageDeflate):
+    def __init__(self, *args: Any, threshold: int, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+        self.skipping = False
+
+    def encode(self, frame: Frame) -> Frame:
+        if frame.opcode in CTRL_OPCODES:
+            return frame
+
+        if frame.opcode is not Opcode.CONT:
+            self.skipping = len(frame.data) < self.threshold
+
+        if self.skipping:
+            compression_stats.skipped_frames += 1
+            return frame
+
+        started_at = time.thread_time()
+        encoded = super().encode(frame)
+        compression_stats.cpu_time += time.thread_time() - started_at
+        compression_stats.compressed_frames += 1
+        compression_stats.raw_bytes += len(frame.data)
+        compression_stats.compressed_bytes += len(encoded.data)
+        return encoded
+
+
+class ThresholdPerMessageDeflateFactory(ServerPerMessageDeflateFactory):
+    def __init__(self, threshold: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.threshold = threshold
+
+    def process_request_params(
+        self,
+        params: Sequence[Tuple[str, str]],
+        accepted_extensions: Sequence[Any],
+    ) -> Tuple[List[Tuple[str, str]], PerMessageDeflate]:
+        response_params, extension = super().process_request_params(
+            params, accepted_extensions
+        )
+        return response_params, ThresholdPerMessageDeflate(
+            extension.remote_no_context_takeover,
+            extension.local_no_context_takeover,
+            extension.remote_max_window_bits,
+            extension.local_max_window_bits,
+            extension.compress_settings,
+            threshold=self.threshold,
+        )
+
+
+if WebSocketsSansIOProtocol is not None:
+
+    class CompressedWebSocketProtocol(WebSocketsSansIOProtocol):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            if self.config.ws_per_message_deflate:
+                self.conn.available_extensions = [
+                    ThresholdPerMessageDeflateFactory(
+                        threshold=get_ws_compression_threshold(),
+                        server_max_window_bits=12,
+                        client_max_window_bits=12,
+                        compress_settings={"memLevel": 5},
+                    )
+                ]
+
+else:
+    from uvicorn.protocols.websockets.websockets_impl import (
+        WebSocketProtocol as CompressedWebSocketProtocol,
+    )
@@ -18,13 +18,17 @@ export type MessageType =
   | "user_unsold"
   | "next_user"
   | "queue_update"
+  | "queue_delta"
   | "init"
+  | "get_teams"
+  | "teams"
   | "status"
   | "error";
 
 export interface WebSocketMessage {
   type: MessageType;
   data: any;
+  seq?: number;
 }
 
 export interface AuctionInitData {
@@ -35,7 +39,10 @@ export interface AuctionInitData {
   currentBid: number | null;
   currentBidder: number | null;
   timer: number;
+  timerDeadline: number | null;
   teams: Team[];
+  teamSeq: number;
+  seq: number;
   auctionQueue: number[];
   unsoldQueue: number[];
   teamId: number | null;
@@ -58,15 +65,28 @@ export interface QueueUpdateData {
   unsoldQueue: number[];
 }
 
+export interface QueueDeltaData {
+  unsold: number | null;
+  recycled: boolean;
+  popped: number | null;
+}
+
 export interface UserSoldData {
-  userId: number;
+  seq: number;
   teamId: number;
-  amount: number;
+  userId: number;
+  price: number;
+  points: number;
+}
+
+export interface TeamsData {
+  seq: number;
   teams: Team[];
 }
 
 export interface TimerData {
   timer: number;
+  deadline: number;
 }
 
 export type Statistics = "NONE" | "LOL" | "VAL";
@@ -3,7 +3,9 @@ import type {
   AuctionInitData,
   BidResponseData,
   NextUserData,
+  QueueDeltaData,
   QueueUpdateData,
+  TeamsData,
   TimerData,
   UserSoldData,
   WebSocketMessage,
@@ -11,6 +13,13 @@ import type {
 import { AUCTION_WS_URL } from "@/config";
 import { toCamelCase } from "@/lib/dtoMapper";
 
+const TIMER_REFRESH_INTERVAL = 200;
+const RECONNECT_DELAY = 1000;
+
+function getDeadline(timer: number): number {
+  return Date.now() + timer * 1000;
+}
+
 interface AuctionWebSocketHook {
   isConnected: boolean;
   wasConnected: boolean;
@@ -34,6 +43,9 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
   const sessionIdRef = useRef<string | null>(null);
   const accessCodeRef = useRef<string | null>(null);
   const mountedRef = useRef(true);
+  const teamSeqRef = useRef(0);
+  const lastSeqRef = useRef<number | null>(null);
+  const reconnectTimeoutRef = useRef<number | null>(null);
 
   const handleWebSocketMessage = (message: WebSocketMessage) => {
     switch (message.type) {
@@ -43,8 +55,14 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
         setIsLeader(data.isLeader);
         setUserId(data.userId);
         setTeamId(data.teamId);
+        teamSeqRef.current = data.teamSeq;
+        lastSeqRef.current = data.seq;
 
-        setState(data);
+        setState({
+          ...data,
+          timerDeadline:
+            data.status === "in_progress" ? getDeadline(data.timer) : null,
+        });
         break;
       }
 
@@ -77,9 +95,45 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
         break;
       }
 
+      case "queue_delta": {
+        const data = toCamelCase<QueueDeltaData>(message.data);
+        setState((prev) => {
+          if (!prev) {
+            return null;
+          }
+
+          let auctionQueue = prev.auctionQueue;
+          let unsoldQueue = prev.unsoldQueue;
+
+          if (data.unsold !== null) {
+            unsoldQueue = [...unsoldQueue, data.unsold];
+          }
+
+          if (data.recycled) {
+            auctionQueue = unsoldQueue;
+            unsoldQueue = [];
+          }
+
+          if (data.popped !== null && auctionQueue[0] === data.popped) {
+            auctionQueue = auctionQueue.slice(1);
+          }
+
+          return { ...prev, auctionQueue, unsoldQueue };
+        });
+        break;
+      }
+
       case "timer": {
         const data = toCamelCase<TimerData>(message.data);
-        setState((prev) => (prev ? { ...prev, timer: data.timer } : null));
+        setState((prev) =>
+          prev
+            ? {
+                ...prev,
+                timer: data.timer,
+                timerDeadline: getDeadline(data.timer),
+              }
+            : null
+        );
         break;
       }
 
@@ -99,10 +153,44 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
 
       case "user_sold": {
         const data = toCamelCase<UserSoldData>(message.data);
+        if (data.seq !== teamSeqRef.current + 1) {
+          requestTeams();
+          break;
+        }
+
+        teamSeqRef.current = data.seq;
+        setState((prev) =>
+          prev
+            ? {
+                ...prev,
+                teamSeq: data.seq,
+                teams: prev.teams.map((team) =>
+                  team.teamId === data.teamId
+                    ? {
+                        ...team,
+                        memberIdList: [...team.memberIdList, data.userId],
+                        points: data.points,
+                      }
+                    : team
+                ),
+              }
+            : null
+        );
+        break;
+      }
+
+      case "teams": {
+        const data = toCamelCase<TeamsData>(message.data);
+        if (data.seq < teamSeqRef.current) {
+          break;
+        }
+
+        teamSeqRef.current = data.seq;
         setState((prev) =>
           prev
             ? {
                 ...prev,
+                teamSeq: data.seq,
                 teams: data.teams,
               }
             : null
@@ -123,6 +211,8 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
             ? {
                 ...prev,
                 status: data.status,
+                timerDeadline:
+                  data.status === "in_progress" ? prev.timerDeadline : null,
               }
             : null
         );
@@ -138,9 +228,17 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
   };
 
   const disconnect = () => {
+    if (reconnectTimeoutRef.current !== null) {
+      clearTimeout(reconnectTimeoutRef.current);
+      reconnectTimeoutRef.current = null;
+    }
+
+    lastSeqRef.current = null;
+
     if (wsRef.current) {
-      wsRef.current.close();
+      const ws = wsRef.current;
       wsRef.current = null;
+      ws.close();
       sessionIdRef.current = null;
       accessCodeRef.current = null;
       setIsConnected(false);
@@ -150,8 +248,15 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
 
   const connect = (token: string) => {
     disconnect();
+    openSocket(token);
+  };
 
-    const url = `${AUCTION_WS_URL}/${token}`;
+  const openSocket = (token: string) => {
+    const lastSeq = lastSeqRef.current;
+    const url =
+      lastSeq === null
+        ? `${AUCTION_WS_URL}/${token}`
+        : `${AUCTION_WS_URL}/${token}?last_seq=${lastSeq}`;
     const ws = new WebSocket(url);
 
     ws.onopen = () => {
@@ -164,6 +269,9 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
     ws.onmessage = (event) => {
       try {
         const message = JSON.parse(event.data) as WebSocketMessage;
+        if (message.seq !== undefined) {
+          lastSeqRef.current = message.seq;
+        }
         if (mountedRef.current) {
           handleWebSocketMessage(message);
         }
@@ -172,10 +280,23 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
       }
     };
 
-    ws.onclose = () => {
+    ws.onclose = (event) => {
       if (mountedRef.current) {
         setIsConnected(false);
       }
+
+      const shouldReconnect =
+        wsRef.current === ws &&
+        mountedRef.current &&
+        event.code !== 1000 &&
+        event.code < 4000;
+
+      if (shouldReconnect) {
+        reconnectTimeoutRef.current = window.setTimeout(() => {
+          reconnectTimeoutRef.current = null;
+          openSocket(token);
+        }, RECONNECT_DELAY);
+      }
     };
 
     ws.onerror = (error) => {
@@ -188,6 +309,14 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
     wsRef.current = ws;
   };
 
+  const requestTeams = () => {
+    if (!wsRef.current) {
+      return;
+    }
+
+    wsRef.current.send(JSON.stringify({ type: "get_teams", data: {} }));
+  };
+
   const placeBid = (amount: number) => {
     if (!wsRef.current) {
       return;
@@ -203,6 +332,21 @@ export function useAuctionWebSocket(): AuctionWebSocketHook {
     wsRef.current.send(JSON.stringify(message));
   };
 
+  useEffect(() => {
+    const interval = setInterval(() => {
+      setState((prev) =>
+        prev && prev.timerDeadline !== null
+          ? {
+              ...prev,
+              timer: Math.max(0, (prev.timerDeadline - Date.now()) / 1000),
+            }
+          : prev
+      );
+    }, TIMER_REFRESH_INTERVAL);
+
+    return () => clearInterval(interval);
+  }, []);
+
   useEffect(() => {
     mountedRef.current = true;
     return () => {
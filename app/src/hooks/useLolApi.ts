@@ -4,9 +4,14 @@ import { LOL_API_URL } from "@/config";
 import { toCamelCase } from "@/lib/dtoMapper";
 
 export const lolApi = {
-  getByUserId: async (userId: number): Promise<LolDto | null> => {
+  getByUserId: async (
+    userId: number,
+    wait: boolean = false
+  ): Promise<LolDto | null> => {
     try {
-      const response = await fetch(`${LOL_API_URL}/${userId}`);
+      const response = await fetch(
+        `${LOL_API_URL}/${userId}${wait ? "?wait=true" : ""}`
+      );
       if (!response.ok) {
         if (response.status === 404) return null;
         throw new Error("Failed to fetch LOL info");
@@ -22,12 +27,12 @@ export const lolApi = {
   },
 };
 
-export const useLolInfo = (userId: number | null) => {
+export const useLolInfo = (userId: number | null, wait: boolean = false) => {
   return useQuery({
-    queryKey: ["lol", userId],
+    queryKey: ["lol", userId, wait],
     queryFn: async () => {
       if (!userId) return null;
-      return await lolApi.getByUserId(userId);
+      return await lolApi.getByUserId(userId, wait);
     },
     enabled: !!userId,
     retry: false,
@@ -4,9 +4,14 @@ import { VAL_API_URL } from "@/config";
 import { toCamelCase } from "@/lib/dtoMapper";
 
 export const valApi = {
-  getByUserId: async (userId: number): Promise<ValDto | null> => {
+  getByUserId: async (
+    userId: number,
+    wait: boolean = false
+  ): Promise<ValDto | null> => {
     try {
-      const response = await fetch(`${VAL_API_URL}/${userId}`);
+      const response = await fetch(
+        `${VAL_API_URL}/${userId}${wait ? "?wait=true" : ""}`
+      );
       if (!response.ok) {
         if (response.status === 404) return null;
         throw new Error("Failed to fetch VAL info");
@@ -22,12 +27,12 @@ export const valApi = {
   },
 };
 
-export const useValInfo = (userId: number | null) => {
+export const useValInfo = (userId: number | null, wait: boolean = false) => {
   return useQuery({
-    queryKey: ["val", userId],
+    queryKey: ["val", userId, wait],
     queryFn: async () => {
       if (!userId) return null;
-      return await valApi.getByUserId(userId);
+      return await valApi.getByUserId(userId, wait);
     },
     enabled: !!userId,
     retry: false,
@@ -237,7 +237,7 @@ export function AuctionPage() {
               <Section variantTone="ghost">
                 <InfoCard
                   label="남은 시간"
-                  value={state.status === "completed" ? 0 : state.timer}
+                  value={state.status === "completed" ? 0 : Math.ceil(state.timer)}
                   variant="time"
                 />
                 <InfoCard
@@ -53,10 +53,12 @@ export function PresetUserEditor({
   const addPresetUserPosition = useAddPresetUserPosition();
   const deletePresetUserPosition = useDeletePresetUserPosition();
   const lolInfo = useLolInfo(
-    statistics === "LOL" ? presetUser.user.userId : null
+    statistics === "LOL" ? presetUser.user.userId : null,
+    true
   );
   const valInfo = useValInfo(
-    statistics === "VAL" ? presetUser.user.userId : null
+    statistics === "VAL" ? presetUser.user.userId : null,
+    true
   );
 
   const [isLeader, setIsLeader] = useState(presetUser.isLeader);